@@ -33,9 +33,10 @@ from .data_collection import DataCollection
 from .api_client import APIClient
 from .closed_events import ClosedEventsAPI
 from .trades import TradesAPI
+from .arrays import TradeArray
 
 # Public API: users should primarily use DataCollection
-__all__ = ["DataCollection"]
+__all__ = ["DataCollection", "TradeArray"]
 
 # Internal APIs (available but not recommended for direct use)
 __all__ += ["APIClient", "ClosedEventsAPI", "TradesAPI"]
@@ -1,6 +1,14 @@
+import gzip
+import hashlib
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Any
-#import requests
+from typing import Any, Optional
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,7 +27,18 @@ class APIClient:
     # This ensures cache is always at datacollection/data/cache regardless of where scripts run from
     DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
 
-    def __init__(self, rate_limit: float = 0.1, cache_dir: Path | str = DEFAULT_CACHE_DIR):
+    # Connection pool sizing and transient-failure retries for the shared session
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
+    RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+
+    def __init__(
+        self,
+        rate_limit: float = 0.1,
+        cache_dir: Path | str = DEFAULT_CACHE_DIR,
+        durable_cache: bool = False,
+        compress_cache: bool = False,
+    ):
         """APIClient with deterministic caching.
         
         All caching is handled internally and automatically. Cache is organized by:
@@ -28,12 +47,41 @@ class APIClient:
         
         Args:
             rate_limit: Delay between API requests in seconds.
+            cache_dir: Root directory for cached responses.
+            durable_cache: If True, fsync every cache write. Off by default since
+                cached pages can always be refetched.
+            compress_cache: If True, store page and prices-history caches
+                gzip-compressed (`.json.gz`), trading a little CPU on each hit
+                for a much smaller cache directory.
         """
         self.sleep = rate_limit
+        self.durable_cache = durable_cache
+        self.compress_cache = compress_cache
+
+        # Earliest monotonic time the next request may be sent (see _throttle)
+        self._next_allowed_ts = 0.0
+        self._throttle_lock = threading.Lock()
         self._closed_events_api = None
         self._trades_api = None
         
         self.cache_dir = Path(cache_dir)
+        self._cache_paths: dict = {}
+        # Directories already created by _ensure_dir
+        self._created_dirs: set = set()
+        self._created_dirs_lock = threading.Lock()
+
+        # One pooled session keeps connections alive across pages and endpoints
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=self.RETRY,
+        ))
+        # Accept-Encoding is left at requests' default, which already lists br
+        # (and zstd) whenever brotli (zstandard) is installed to decode them
+        self._session.headers.update({
+            "User-Agent": "polymarket-datacollection/0.1.0",
+        })
 
     @property
     def closed_events(self):
@@ -61,6 +109,26 @@ class APIClient:
 
         return self._trades_api
 
+    def close(self) -> None:
+        """Flush buffered progress and release pooled connections."""
+        if self._closed_events_api is not None:
+            self._closed_events_api.close()
+        self._session.close()
+
+    def _throttle(self) -> None:
+        """Block only as long as needed to keep requests `rate_limit` seconds apart.
+
+        Time already spent parsing or writing cache since the previous request
+        counts towards the gap, so consecutive requests are not always slept on.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_allowed_ts - now
+            self._next_allowed_ts = max(now, self._next_allowed_ts) + self.sleep
+
+        if wait > 0:
+            time.sleep(wait)
+
     def _get_cache_dir(self, endpoint_type: str) -> Path:
         """Get the cache directory for a specific endpoint type.
         
@@ -70,9 +138,34 @@ class APIClient:
         Returns:
             Path to cache directory for this endpoint type.
         """
-        cache_dir = self.cache_dir / endpoint_type
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        return self._ensure_dir(self.cache_dir / endpoint_type)
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create `path` (with parents) once per client; later calls skip the syscalls."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            with self._created_dirs_lock:
+                self._created_dirs.add(path)
+        return path
+
+    def _recreate_dir(self, path: Path) -> Path:
+        """Create `path` again after finding it missing (e.g. the cache tree was deleted).
+
+        Drops it and its parents from the _ensure_dir memo so later calls don't
+        trust the stale entries, then creates it.
+        """
+        with self._created_dirs_lock:
+            for stale in (path, *path.parents):
+                self._created_dirs.discard(stale)
+        return self._ensure_dir(path)
+
+    def _open_append(self, path: Path):
+        """Open `path` for binary append, recreating its directory once if it is gone."""
+        try:
+            return open(path, 'ab')
+        except FileNotFoundError:
+            self._recreate_dir(path.parent)
+            return open(path, 'ab')
 
     def _cache_path(self, endpoint_type: str, **params: Any) -> Path:
         """Return a cache subdirectory path for specific query params.
@@ -84,10 +177,111 @@ class APIClient:
         Returns:
             Path to cache subdirectory for these specific parameters.
             
-        Uses a directory named after stable filtering parameters (excluding
-        offset/limit) with readable key=value segments for easier inspection.
+        The directory name is a short blake2b digest of the sorted non-None
+        params, so its length doesn't grow with the number of filters; a
+        manifest.json inside records the real params for inspection.
+        Directories created under the older readable key=value naming are
+        still used when present. Paths are memoized per (endpoint_type, params),
+        so the name is built and the directories created only once per client.
+        """
+        # The canonical manifest bytes double as the memo key; unlike the raw
+        # params they are hashable even when a value is a list
+        items = sorted((k, v) for k, v in params.items() if v is not None)
+        manifest = orjson.dumps(dict(items), default=str)
+        key = (endpoint_type, manifest)
+        path = self._cache_paths.get(key)
+        if path is None:
+            base_cache = self._get_cache_dir(endpoint_type)
+            legacy = base_cache / "__".join(f"{k}={v}" for k, v in items)
+            if items and self._is_legacy_dir(legacy):
+                path = legacy
+            else:
+                path = base_cache / hashlib.blake2b(manifest, digest_size=12).hexdigest()
+                if not (path / "manifest.json").exists():
+                    self._write_cache_file(path / "manifest.json", manifest)
+            self._cache_paths[key] = path
+        return path
+
+    @staticmethod
+    def _is_legacy_dir(path: Path) -> bool:
+        """Whether an old key=value cache directory exists at `path`.
+
+        Names too long for the filesystem (exactly what digest naming is for)
+        can't exist, and probing them raises ENAMETOOLONG, so they count as absent.
         """
-        base_cache = self._get_cache_dir(endpoint_type)
-        info = [f"{k}={v}" for k, v in sorted(params.items()) if v is not None]
-        safe = "__".join(info)
-        return base_cache / safe
+        try:
+            return path.is_dir()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _datasync(fd: int) -> None:
+        """Flush a file's data to disk.
+
+        Uses fdatasync where available, which skips the inode timestamp flush
+        a full fsync also waits for; falls back to fsync elsewhere.
+        """
+        if hasattr(os, "fdatasync"):
+            os.fdatasync(fd)
+        else:
+            os.fsync(fd)
+
+    @staticmethod
+    def _compressed_path(path: Path) -> Path:
+        return path.with_name(path.name + ".gz")
+
+    def _read_cache_file(self, path: Path) -> Optional[bytes]:
+        """Read a cache file, also looking for its gzip-compressed variant.
+
+        The variant matching `compress_cache` is tried first.
+
+        Returns:
+            The decompressed bytes, or None if neither file exists.
+        """
+        candidates = [(self._compressed_path(path), True), (path, False)]
+        if not self.compress_cache:
+            candidates.reverse()
+
+        for candidate, compressed in candidates:
+            try:
+                payload = candidate.read_bytes()
+            except FileNotFoundError:
+                continue
+            return gzip.decompress(payload) if compressed else payload
+        return None
+
+    def _write_cache_file(
+        self,
+        path: Path,
+        payload: bytes,
+        sync: Optional[bool] = None,
+        compress: bool = False,
+    ) -> None:
+        """Write raw bytes to a cache file.
+
+        Args:
+            path: Destination file (parent directories are created).
+            payload: Serialized content to write.
+            sync: Force (True) or skip (False) an fsync; defaults to durable_cache.
+            compress: Write gzip-compressed to `<path>.gz` instead.
+        """
+        if sync is None:
+            sync = self.durable_cache
+
+        if compress:
+            path = self._compressed_path(path)
+            payload = gzip.compress(payload, compresslevel=1)
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(path, flags, 0o644)
+        except FileNotFoundError:
+            # Only pay for mkdir when the directory is actually missing
+            self._recreate_dir(path.parent)
+            fd = os.open(path, flags, 0o644)
+        try:
+            os.write(fd, payload)
+            if sync:
+                self._datasync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,72 @@
+"""Columnar (struct-of-arrays) containers for trade and price datapoints.
+
+The API hands back datapoints as a list of dicts; for filtering and
+aggregation it is far cheaper to hold each field as its own contiguous NumPy
+column, so per-row work becomes one vectorized operation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class TradeArray:
+    """Parallel columns of timestamps, sizes and prices.
+
+    Row i is (ts[i], size[i], price[i]). Fields missing from the source
+    datapoints are stored as 0 (ts) or NaN (size, price); prices-history
+    points, for instance, carry no size.
+
+    Equality and hashing are by identity; the generated field-wise versions
+    would compare ndarrays, whose truth value is ambiguous. Compare columns
+    with np.array_equal instead.
+    """
+
+    ts: np.ndarray
+    size: np.ndarray
+    price: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __getitem__(self, key: Any) -> TradeArray:
+        """Select rows (slice, index array or boolean mask) across all columns."""
+        return TradeArray(ts=self.ts[key], size=self.size[key], price=self.price[key])
+
+    @classmethod
+    def from_dicts(
+        cls,
+        trades: Iterable[Dict[str, Any]],
+        ts_key: str = "t",
+        size_key: str = "size",
+        price_key: str = "price",
+    ) -> TradeArray:
+        """Build the columns from a list of datapoint dicts.
+
+        Args:
+            trades: Datapoints, e.g. [{"t": ..., "size": ..., "price": ...}, ...].
+            ts_key: Key holding the unix timestamp.
+            size_key: Key holding the trade size.
+            price_key: Key holding the price ("p" for prices-history points).
+
+        Returns:
+            TradeArray with int64 ts and float64 size/price columns.
+        """
+        trades = trades if isinstance(trades, (list, tuple)) else list(trades)
+        n = len(trades)
+        return cls(
+            ts=np.fromiter((trade.get(ts_key, 0) for trade in trades), dtype=np.int64, count=n),
+            size=np.fromiter((trade.get(size_key, np.nan) for trade in trades), dtype=np.float64, count=n),
+            price=np.fromiter((trade.get(price_key, np.nan) for trade in trades), dtype=np.float64, count=n),
+        )
+
+    def to_dicts(self, ts_key: str = "t", size_key: str = "size", price_key: str = "price") -> List[Dict[str, Any]]:
+        """Inverse of from_dicts(), for callers that still want rows."""
+        return [
+            {ts_key: t, size_key: s, price_key: p}
+            for t, s, p in zip(self.ts.tolist(), self.size.tolist(), self.price.tolist())
+        ]
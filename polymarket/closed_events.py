@@ -3,19 +3,50 @@
 This module provides methods to fetch closed markets/events with resilient
 pagination handling. It wraps the base APIClient to separate concerns.
 """
-import json
+import atexit
 import os
+import re
+import struct
 import time
 import logging
+import threading
+import weakref
+import orjson
 import requests
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
 from typing import Iterator, Dict, Any, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Cached page files: offset_<N>.json, optionally gzip-compressed
+_PAGE_FILE = re.compile(r"offset_(\d+)\.json(?:\.gz)?")
+
+# `.complete` marker payload: event count and byte size of the consolidated file
+_COMPLETE_MARKER = struct.Struct("<QQ")
+
+# Instances with progress that may still be buffered; flushed at interpreter exit
+_PROGRESS_WRITERS: "weakref.WeakSet[ClosedEventsAPI]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_progress() -> None:
+    for api in list(_PROGRESS_WRITERS):
+        api.flush_progress()
+
 
 class ClosedEventsAPI:
     """API client for fetching closed Polymarket events."""
 
+    # Number of pages kept in memory (as JSON bytes) in front of the disk cache
+    PAGE_CACHE_SIZE = 64
+    # Seconds buffered progress updates wait before being written in the background
+    PROGRESS_FLUSH_INTERVAL = 0.5
+    # Threads used to parse already-cached pages before resuming over the network
+    HYDRATE_WORKERS = 8
+
     def __init__(self, base_client):
         """Initialize with a base APIClient instance.
         
@@ -23,47 +54,123 @@ class ClosedEventsAPI:
             base_client: Instance of APIClient with core fetching logic.
         """
         self._client = base_client
+        # Pages are kept as their JSON bytes and parsed on every hit, so callers
+        # (and _intern_event) can mutate what they get without touching the cache
+        self._page_cache: OrderedDict[tuple, bytes] = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+
+        # Progress is an advisory resume hint, so per-page updates are coalesced
+        # in memory and written by a background timer (one write per file per flush)
+        self._pending_progress: Dict[Path, int] = {}
+        self._progress_lock = threading.Lock()
+        self._progress_timer: Optional[threading.Timer] = None
+        # Last offset this client wrote or read per progress file, so repeated
+        # _get_progress calls don't stat and parse the file again
+        self._known_progress: Dict[Path, int] = {}
+        _PROGRESS_WRITERS.add(self)
+
+    def _remember_page(self, key: tuple, raw: bytes, page: List[Dict[str, Any]]) -> None:
+        """Insert a page's bytes into the in-memory LRU, evicting the oldest entry."""
+        if not page:
+            return
+
+        with self._page_cache_lock:
+            self._page_cache[key] = raw
+            self._page_cache.move_to_end(key)
+            if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+
+    def _query_cache_dir(self, **query_params: Any) -> Path:
+        """Return the cache directory for a query, ignoring offset/limit."""
+        page_params = {k: v for k, v in query_params.items() if k not in ['offset', 'limit']}
+        return self._client._cache_path('fetch_closed_markets', **page_params)
 
-    def _fetch_page(self, **params: Any) -> List[Dict[str, Any]]:
+    def _cached_page(self, cache_dir: Path, **params: Any) -> Optional[List[Dict[str, Any]]]:
+        """Return a page from the in-memory LRU or the disk cache, or None on a miss.
+
+        Args:
+            cache_dir: Query cache directory.
+            params: Query parameters including limit/offset.
+        """
+        key = tuple(sorted(params.items()))
+        with self._page_cache_lock:
+            raw = self._page_cache.get(key)
+            if raw is not None:
+                self._page_cache.move_to_end(key)
+        if raw is not None:
+            return orjson.loads(raw)
+
+        path = cache_dir / f"offset_{params.get('offset', 0)}.json"
+        try:
+            raw = self._client._read_cache_file(path)
+            if raw is None:
+                logger.info(f"No cache found at {path}, fetching from API.")
+                return None
+            logger.info(f"Loading cached page from {path}")
+            page = orjson.loads(raw)
+        except (orjson.JSONDecodeError, OSError, EOFError):
+            logger.warning(f"Corrupted cache at {path}, refetching.")
+            return None
+
+        self._remember_page(key, raw, page)
+        return page
+
+    def _fetch_page(self, cache_dir: Optional[Path] = None, **params: Any) -> List[Dict[str, Any]]:
         """Fetch a single page from the /events endpoint.
 
         Includes lightweight caching. If the API intermittently returns fewer
         results than requested (e.g., limit=1000 returns ~400 due to load), we
         treat whatever comes back as authoritative for that slice and move the
         offset forward by the actual number of items received to avoid gaps.
+
+        Args:
+            cache_dir: Precomputed query cache directory (computed from params if None).
+            params: Query parameters including limit/offset.
         """
-        page_params = {k: v for k, v in params.items() if k not in ['limit', 'offset']}
-        path = self._client._cache_path('fetch_closed_markets', **page_params) / f"offset_{params.get('offset', 0)}.json"
+        if cache_dir is None:
+            cache_dir = self._query_cache_dir(**params)
 
-        if path.exists():
-            try:
-                logger.info(f"Loading cached page from {path}")
-                return json.loads(path.read_text())
-            except json.JSONDecodeError:
-                logger.warning(f"Corrupted cache at {path}, refetching.")
-        else:
-            logger.info(f"No cache found at {path}, fetching from API.")
+        page = self._cached_page(cache_dir, **params)
+        if page is not None:
+            return page
+
+        raw, data = self._download_page(**params)
+        self._store_page(cache_dir, raw, data, **params)
+        return data
+
+    def _speculative_page(self, cache_dir: Path, **params: Any) -> tuple:
+        """Prefetch worker: like _fetch_page(), but a downloaded page is not cached.
 
+        Returns:
+            (page, raw) where raw is None if the page came from the cache; the
+            consumer stores a downloaded page only if it actually uses it.
+        """
+        page = self._cached_page(cache_dir, **params)
+        if page is not None:
+            return page, None
+        raw, data = self._download_page(**params)
+        return data, raw
+
+    def _download_page(self, **params: Any) -> tuple:
+        """GET one /events page; returns (raw body bytes, parsed events)."""
         url = f"{self._client.BASEURL}/events"
+        self._client._throttle()
         try:
-            response = requests.get(url, params=params, timeout=25)
+            response = self._client._session.get(url, params=params, timeout=25)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Request failed for params={params}: {e}")
             raise
 
-        data = response.json()
+        # Parse the body bytes once and cache them verbatim (no re-serialization)
+        raw = response.content
+        return raw, orjson.loads(raw)
 
-        path.parent.mkdir(parents=True, exist_ok=True)
-        # Write with explicit flush and sync to ensure data is on disk
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
-
-        # Respect a minimal delay to avoid hammering endpoint
-        time.sleep(self._client.sleep)
-        return data
+    def _store_page(self, cache_dir: Path, raw: bytes, page: List[Dict[str, Any]], **params: Any) -> None:
+        """Write a downloaded page to the disk cache and the in-memory LRU."""
+        path = cache_dir / f"offset_{params.get('offset', 0)}.json"
+        self._client._write_cache_file(path, raw, compress=self._client.compress_cache)
+        self._remember_page(tuple(sorted(params.items())), raw, page)
 
     def fetch_page_no_cache(self, **params: Any) -> List[Dict[str, Any]]:
         """Fetch a single /events page WITHOUT touching cache or progress.
@@ -72,51 +179,351 @@ class ClosedEventsAPI:
         """
         url = f"{self._client.BASEURL}/events"
         clean = {k: v for k, v in params.items() if v is not None}
+        self._client._throttle()
         try:
-            response = requests.get(url, params=clean, timeout=15)
+            response = self._client._session.get(url, params=clean, timeout=15)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Preview request failed for params={clean}: {e}")
             return []
-        return response.json()
+        return orjson.loads(response.content)
+
+    def fetch_page_etag(self, **params: Any) -> Optional[List[Dict[str, Any]]]:
+        """Fetch a single /events page, conditional on its last seen ETag.
+
+        Like fetch_page_no_cache(), but the response's ETag is kept in a small
+        file under the query's cache directory (one file per limit/offset) and
+        sent back as If-None-Match, so an unchanged page costs a 304 with no
+        body. Pages and progress are not written. Params are used as given:
+        iter_events() always sends closed and ascending, so its directory is
+        only shared when the same values are passed here explicitly.
+
+        Returns:
+            The page's events, None if the server reported it unchanged (304),
+            or [] if the request failed.
+        """
+        url = f"{self._client.BASEURL}/events"
+        # Booleans go out as "true"/"false", as iter_events() sends them
+        clean = {
+            k: str(v).lower() if isinstance(v, bool) else v
+            for k, v in params.items()
+            if v is not None
+        }
+        etag_file = self._query_cache_dir(**clean) / (
+            f"etag_limit_{clean.get('limit', '')}_offset_{clean.get('offset', 0)}.json"
+        )
+        try:
+            etag = orjson.loads(etag_file.read_bytes()).get("etag")
+        except (OSError, orjson.JSONDecodeError):
+            etag = None
+
+        self._client._throttle()
+        try:
+            response = self._client._session.get(
+                url,
+                params=clean,
+                headers={"If-None-Match": etag} if etag else None,
+                timeout=15,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Conditional request failed for params={clean}: {e}")
+            return []
 
-    def _update_progress(self, total_fetched: int, **query_params: Any):
+        if response.status_code == 304:
+            return None
+
+        if new_etag := response.headers.get("ETag"):
+            try:
+                self._client._write_cache_file(etag_file, orjson.dumps({"etag": new_etag}))
+            except OSError as e:
+                logger.debug(f"Failed to save ETag to {etag_file}: {e}")
+        return orjson.loads(response.content)
+
+    def _iter_cached_run(
+        self,
+        cache_dir: Path,
+        offset: int,
+        **params: Any,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the contiguous run of cached pages starting at `offset`.
+
+        Cached page files are parsed in parallel on a thread pool (file reads and
+        orjson parsing release the GIL) and yielded in offset order. At most
+        2 * HYDRATE_WORKERS pages are read ahead of the consumer, so a large cache
+        is not loaded into memory at once. Stops at the first gap, unreadable
+        page, or cached empty page (which is yielded).
+
+        Args:
+            cache_dir: Query cache directory.
+            offset: Offset of the first page to yield.
+            params: Query parameters including limit (offset is supplied per page).
+        """
+        cached = set()
+        try:
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    match = _PAGE_FILE.fullmatch(entry.name)
+                    if match and int(match.group(1)) >= offset:
+                        cached.add(int(match.group(1)))
+        except FileNotFoundError:
+            # Cache tree removed while the client was alive; page writes recreate it
+            return
+
+        offsets = sorted(cached)
+        if not offsets or offsets[0] != offset:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.HYDRATE_WORKERS)
+        window: deque = deque()
+        queued = iter(offsets)
+
+        def submit_next() -> None:
+            page_offset = next(queued, None)
+            if page_offset is not None:
+                window.append((
+                    page_offset,
+                    executor.submit(self._cached_page, cache_dir, **{**params, "offset": page_offset}),
+                ))
+
+        try:
+            for _ in range(self.HYDRATE_WORKERS * 2):
+                submit_next()
+            expected = offset
+            while window:
+                page_offset, future = window.popleft()
+                page = future.result()
+                submit_next()
+                # Skip pages left behind at offsets the pagination never landed on
+                if page_offset < expected:
+                    continue
+                if page_offset > expected or page is None:
+                    return
+                yield page
+                if not page:
+                    return
+                expected += len(page)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _completion(self, cache_dir: Path) -> Optional[tuple]:
+        """Return (event_count, consolidated_size) for a completed query, or None.
+
+        Completion is recorded in a fixed-layout `.complete` marker. Caches from
+        older versions mark it with `is_complete` in progress.json instead, in
+        which case both values are None.
+        """
+        try:
+            return _COMPLETE_MARKER.unpack((cache_dir / ".complete").read_bytes())
+        except FileNotFoundError:
+            pass
+        except struct.error:
+            return None
+
+        try:
+            progress = orjson.loads((cache_dir / "progress.json").read_bytes())
+        except (orjson.JSONDecodeError, OSError):
+            return None
+        return (None, None) if progress.get("is_complete", False) else None
+
+    def _mark_complete(self, cache_dir: Path, event_count: int, consolidated_size: int) -> None:
+        """Atomically write the `.complete` marker once the consolidated file is in place."""
+        marker = cache_dir / ".complete"
+        tmp_marker = marker.with_name(marker.name + ".tmp")
+        self._client._write_cache_file(tmp_marker, _COMPLETE_MARKER.pack(event_count, consolidated_size))
+        os.replace(tmp_marker, marker)
+
+    def _consolidated_file(self, cache_dir: Path) -> Optional[Path]:
+        """Return the consolidated file of a completed query, or None.
+
+        New caches are written as JSON-Lines (`consolidated.jsonl`); a legacy
+        `consolidated.json` list is used when no .jsonl file exists.
+        """
+        completion = self._completion(cache_dir)
+        if completion is None:
+            return None
+
+        for name in ("consolidated.jsonl", "consolidated.json"):
+            consolidated_file = cache_dir / name
+            try:
+                size = consolidated_file.stat().st_size
+            except FileNotFoundError:
+                continue
+            # Cache writes aren't fsynced, so a crash can leave a short file behind
+            expected = completion[1]
+            if expected is not None and size != expected:
+                logger.warning(f"Consolidated cache {consolidated_file} is {size} bytes, expected {expected}; ignoring it.")
+                return None
+            return consolidated_file
+        return None
+
+    @staticmethod
+    def _iter_consolidated(consolidated_file: Path) -> Iterator[Dict[str, Any]]:
+        """Yield events from a consolidated file, one line at a time for .jsonl."""
+        if consolidated_file.suffix == ".jsonl":
+            with open(consolidated_file, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
+        else:
+            yield from orjson.loads(consolidated_file.read_bytes())
+
+    def _load_consolidated(self, cache_dir: Path) -> Optional[List[Dict[str, Any]]]:
+        """Return all events of a completed query from its single consolidated file.
+
+        Returns:
+            The event list, or None if the query is not marked complete or the
+            consolidated file is missing/unreadable.
+        """
+        consolidated_file = self._consolidated_file(cache_dir)
+        if consolidated_file is None:
+            return None
+
+        try:
+            events = list(self._iter_consolidated(consolidated_file))
+        except (orjson.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load consolidated cache: {e}. Falling back to page cache.")
+            return None
+
+        expected = (self._completion(cache_dir) or (None,))[0]
+        if expected is not None and len(events) != expected:
+            logger.warning(f"Consolidated cache holds {len(events)} events, expected {expected}. Falling back to page cache.")
+            return None
+        return events
+
+    def _probe(self, offset: int, **params: Any):
+        """Request a single event at `offset` (no cache); returns (events, response)."""
+        url = f"{self._client.BASEURL}/events"
+        self._client._throttle()
+        response = self._client._session.get(url, params={**params, "limit": 1, "offset": offset}, timeout=15)
+        response.raise_for_status()
+        return orjson.loads(response.content), response
+
+    def probe_count(self, **params: Any) -> int:
+        """Count events matching a query without downloading full pages.
+
+        Uses the X-Total-Count header when the server provides one. Otherwise
+        finds the first empty offset with limit=1 probes: doubling until a probe
+        comes back empty, then binary searching, i.e. ~2*log2(N) tiny requests.
+
+        Args:
+            params: Query filters (limit/offset are ignored).
+
+        Returns:
+            Number of events matching the query.
+        """
+        clean = {k: v for k, v in params.items() if v is not None and k not in ['limit', 'offset']}
+
+        events, response = self._probe(0, **clean)
+        total = response.headers.get("X-Total-Count")
+        if total is not None and total.isdigit():
+            return int(total)
+        if not events:
+            return 0
+
+        # Invariant: an event exists at offset `lo`; none exists at offset `hi`
+        lo, hi = 0, 1
+        while self._probe(hi, **clean)[0]:
+            lo, hi = hi, hi * 2
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self._probe(mid, **clean)[0]:
+                lo = mid
+            else:
+                hi = mid
+
+        return hi
+
+    def _update_progress(
+        self,
+        total_fetched: int,
+        final: bool = False,
+        cache_dir: Optional[Path] = None,
+        **query_params: Any,
+    ):
         """Update progress for a specific query parameter set.
         
         Args:
             total_fetched: The offset to save as progress
+            final: Whether this is the last write of a fetch; only final writes are fsynced
+                (unless the client uses durable_cache)
+            cache_dir: Precomputed query cache directory (computed from query_params if None)
             query_params: The query parameters that uniquely identify this fetch operation
         """
         # Get the parameter-specific cache directory
-        page_params = {k: v for k, v in query_params.items() if k not in ['offset', 'limit']}
-        cache_path = self._client._cache_path('fetch_closed_markets', **page_params)
-        progress_file = cache_path / "progress.json"
-        
+        if cache_dir is None:
+            cache_dir = self._query_cache_dir(**query_params)
+        progress_file = cache_dir / "progress.json"
+
+        with self._progress_lock:
+            self._known_progress[progress_file] = total_fetched
+            if final:
+                # Written synchronously; drop any buffered value so it can't overwrite this one
+                self._pending_progress.pop(progress_file, None)
+                self._write_progress(progress_file, total_fetched, sync=True)
+                return
+
+            self._pending_progress[progress_file] = total_fetched
+            if self._progress_timer is None:
+                self._progress_timer = threading.Timer(self.PROGRESS_FLUSH_INTERVAL, self.flush_progress)
+                self._progress_timer.daemon = True
+                self._progress_timer.start()
+
+    def _write_progress(self, progress_file: Path, total_fetched: int, sync: Optional[bool] = None):
+        """Write a progress record to disk.
+
+        Written to a temp file and renamed into place, so a crash mid-write
+        can't leave a truncated progress.json for the next resume to trip on.
+        """
         progress = {"total_fetched": total_fetched, "last_offset": total_fetched}
-        progress_file.parent.mkdir(parents=True, exist_ok=True)
-        # Write with explicit flush and sync to ensure progress is saved
-        with open(progress_file, 'w') as f:
-            json.dump(progress, f)
-            f.flush()
-            os.fsync(f.fileno())
-
-    def _get_progress(self, **query_params: Any) -> int:
+        tmp = progress_file.with_name(progress_file.name + ".tmp")
+        self._client._write_cache_file(tmp, orjson.dumps(progress), sync=sync)
+        os.replace(tmp, progress_file)
+
+    def flush_progress(self) -> None:
+        """Write all buffered progress updates to disk."""
+        with self._progress_lock:
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+
+            pending, self._pending_progress = self._pending_progress, {}
+            for progress_file, total_fetched in pending.items():
+                try:
+                    self._write_progress(progress_file, total_fetched)
+                except OSError as e:
+                    logger.warning(f"Failed to write progress to {progress_file}: {e}")
+
+    def close(self) -> None:
+        """Flush buffered progress; call when done with the client."""
+        self.flush_progress()
+
+    def _get_progress(self, cache_dir: Optional[Path] = None, **query_params: Any) -> int:
         """Get progress for a specific query parameter set.
         
         Args:
+            cache_dir: Precomputed query cache directory (computed from query_params if None)
             query_params: The query parameters that uniquely identify this fetch operation
             
         Returns:
             The last offset saved, or 0 if no progress exists
         """
         # Get the parameter-specific cache directory
-        page_params = {k: v for k, v in query_params.items() if k not in ['offset', 'limit']}
-        cache_path = self._client._cache_path('fetch_closed_markets', **page_params)
-        progress_file = cache_path / "progress.json"
+        if cache_dir is None:
+            cache_dir = self._query_cache_dir(**query_params)
+        progress_file = cache_dir / "progress.json"
+
+        with self._progress_lock:
+            if progress_file in self._known_progress:
+                return self._known_progress[progress_file]
         
-        if progress_file.exists():
-            return json.loads(progress_file.read_text()).get("last_offset", 0)
-        return 0
+        if not progress_file.exists():
+            return 0
+        offset = orjson.loads(progress_file.read_bytes()).get("last_offset", 0)
+        with self._progress_lock:
+            # A concurrent update wins over the value just read from disk
+            return self._known_progress.setdefault(progress_file, offset)
 
     def iter_events(
         self,
@@ -130,6 +537,7 @@ class ClosedEventsAPI:
         max_pages: Optional[int] = None,
         max_retries_short_page: int = 2,
         batch: bool = True,
+        prefetch: int = 0,
         **extra_params: Any,
     ) -> Iterator[Dict[str, Any]] | Iterator[List[Dict[str, Any]]]:
         """Yield events with resilient pagination.
@@ -144,6 +552,8 @@ class ClosedEventsAPI:
             max_pages: Safety cap to avoid infinite loops (None = no cap).
             max_retries_short_page: Attempts to refetch a short page before accepting it.
             batch: If True, yield entire pages as lists; if False, yield individual events.
+            prefetch: Number of pages to request ahead on worker threads while the
+                current page is consumed (0 = strictly sequential).
             extra_params: Any other query params.
         """
         # Build base query parameters (excluding offset/limit for progress tracking)
@@ -157,62 +567,141 @@ class ClosedEventsAPI:
         }
 
         query_params = {k: v for k, v in base_params.items() if v is not None}
+
+        # Resolve and create the query cache directory once for the whole pagination
+        cache_dir = self._query_cache_dir(**query_params)
+        self._client._ensure_dir(cache_dir)
         
         if offset is None:
-            offset = self._get_progress(**query_params)
+            offset = self._get_progress(cache_dir=cache_dir, **query_params)
             logger.info(f"DEBUG: Resuming from offset={offset} based on progress")
 
+        # A completed query rehydrates from one consolidated file instead of
+        # opening every cached page
+        if offset == 0:
+            events = self._load_consolidated(cache_dir)
+            if events is not None:
+                logger.info(f"Loaded {len(events)} events from consolidated cache in {cache_dir}")
+                for pages_fetched, start in enumerate(range(0, len(events), limit)):
+                    if max_pages is not None and pages_fetched >= max_pages:
+                        break
+                    if batch:
+                        yield events[start:start + limit]
+                    else:
+                        yield from events[start:start + limit]
+                return
+
+        # Replay the already-cached prefix first; only then fall through to the network
         pages_fetched = 0
-        while True:
+        complete = False
+        for page in self._iter_cached_run(cache_dir, offset, limit=limit, **query_params):
             if max_pages is not None and pages_fetched >= max_pages:
-                logger.info("Reached max_pages cap; stopping pagination.")
                 break
-
-            # Add pagination parameters
-            params = {
-                "limit": limit,
-                "offset": offset,
-                **query_params,
-            }
-
-            attempt = 0
-            page: List[Dict[str, Any]] = []
-            while attempt <= max_retries_short_page:
-                page = self._fetch_page(**params)
-
-                if len(page) == 0:
-                    break  
-
-                if len(page) < limit and attempt < max_retries_short_page:
-                    logger.debug(
-                        f"Short page (len={len(page)} < {limit}) at offset={offset}, retry {attempt+1}/{max_retries_short_page}."
-                    )
-
-                    time.sleep(self._client.sleep * (attempt + 1))
-                    attempt += 1
-                    continue
-
-                break
-
             if not page:
-                logger.info("Empty page received; pagination complete.")
+                logger.info("Cached empty page; pagination complete.")
+                complete = True
                 break
 
-            actual_fetched = len(page)
-            logger.debug(f"Fetched {actual_fetched} events at offset {offset} (limit={limit}).")
-            
-            # Yield entire page or individual events based on batch mode
             if batch:
                 yield page
             else:
                 yield from page
-            
-            self._update_progress(offset + actual_fetched, **query_params)
-            pages_fetched += 1  
-            offset += actual_fetched
 
-            if actual_fetched == 0:
-                break
+            self._update_progress(offset + len(page), cache_dir=cache_dir, **query_params)
+            pages_fetched += 1
+            offset += len(page)
+
+        # Worker threads speculatively fetch the pages after the current one,
+        # assuming they come back full; misaligned requests are dropped without
+        # being cached. A short page means the end is near (or offsets have
+        # shifted), so speculation stops for the rest of the query.
+        executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 0 else None
+        speculate = executor is not None
+        pending: Dict[int, Future] = {}
+
+        # Pagination parameters are built once; only the offset changes per page
+        params = {
+            "limit": limit,
+            "offset": offset,
+            **query_params,
+        }
+
+        try:
+            while not complete:
+                if max_pages is not None and pages_fetched >= max_pages:
+                    logger.info("Reached max_pages cap; stopping pagination.")
+                    break
+
+                params["offset"] = offset
+
+                if speculate:
+                    for ahead in range(1, prefetch + 1):
+                        if max_pages is not None and pages_fetched + ahead >= max_pages:
+                            break
+                        ahead_offset = offset + ahead * limit
+                        if ahead_offset not in pending:
+                            pending[ahead_offset] = executor.submit(
+                                self._speculative_page, cache_dir, **{**params, "offset": ahead_offset}
+                            )
+
+                attempt = 0
+                page: List[Dict[str, Any]] = []
+                while attempt <= max_retries_short_page:
+                    future = pending.pop(offset, None) if attempt == 0 else None
+                    if future is not None:
+                        page, raw = future.result()
+                        if raw is not None:
+                            self._store_page(cache_dir, raw, page, **params)
+                    else:
+                        page = self._fetch_page(cache_dir, **params)
+
+                    if len(page) == 0:
+                        break  
+
+                    if len(page) < limit and attempt < max_retries_short_page:
+                        logger.debug(
+                            f"Short page (len={len(page)} < {limit}) at offset={offset}, retry {attempt+1}/{max_retries_short_page}."
+                        )
+
+                        time.sleep(self._client.sleep * (attempt + 1))
+                        attempt += 1
+                        continue
+
+                    break
+
+                if not page:
+                    logger.info("Empty page received; pagination complete.")
+                    break
+
+                actual_fetched = len(page)
+                logger.debug(f"Fetched {actual_fetched} events at offset {offset} (limit={limit}).")
+
+                # A short page shifts every following offset, so speculative pages
+                # are stale; they are discarded uncached and no more are queued
+                if actual_fetched < limit:
+                    speculate = False
+                    for stale in pending.values():
+                        stale.cancel()
+                    pending.clear()
+                
+                # Yield entire page or individual events based on batch mode
+                if batch:
+                    yield page
+                else:
+                    yield from page
+                
+                self._update_progress(offset + actual_fetched, cache_dir=cache_dir, **query_params)
+                pages_fetched += 1  
+                offset += actual_fetched
+
+                if actual_fetched == 0:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # Persist the final offset durably once pagination stops
+        self._update_progress(offset, final=True, cache_dir=cache_dir, **query_params)
 
     def fetch_all(
         self,
@@ -226,18 +715,8 @@ class ClosedEventsAPI:
 
         Uses resilient pagination to avoid missing data when pages are short.
         """
-        results: List[Dict[str, Any]] = []
-        seen_ids: set[str] = set()
-
-        #check the cache directory if we have already fetched the requested data
-        cache_path = self._client._cache_path(
-            endpoint_type = 'events',
-            closed=True,
-            start_date_min=start_date_min,
-            end_date_max=end_date_max,
-            tag_id=tag_id,
-            **extra_params,
-        )
+        # Keyed by event id; setdefault keeps the first occurrence of each event
+        by_id: Dict[str, Dict[str, Any]] = {}
 
         # Build iteration parameters
         iter_params = {
@@ -249,13 +728,116 @@ class ClosedEventsAPI:
             **extra_params,
         }
 
-        for ev in self.iter_events(**iter_params):
-            ev_id = str(ev.get("id"))
-            if ev_id in seen_ids:
-                continue
+        # Consume whole pages so the generator resumes once per page, not per event
+        for page in self.iter_events(batch=True, **iter_params):
+            for ev in page:
+                by_id.setdefault(str(ev.get("id")), ev)
+
+        logger.info(f"Total closed events fetched: {len(by_id)}")
+        return list(by_id.values())
+
+    def fetch_all_bulk(
+        self,
+        start_date_min: Optional[str] = None,
+        end_date_max: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        limit: int = 1000,
+        max_workers: int = 4,
+        **extra_params: Any,
+    ) -> List[Dict[str, Any]]:
+        """Like fetch_all(), but requests every page concurrently.
 
-            seen_ids.add(ev_id)
-            results.append(ev)
+        One probe_count() call learns the total, then all `ceil(total/limit)`
+        offsets are fetched on a thread pool. Short pages are topped up by
+        refetching from where they ended, so no events are skipped. Wall time
+        drops from roughly N*RTT to N/max_workers*RTT (still subject to the
+        client's rate limit).
 
-        logger.info(f"Total closed events fetched: {len(results)}")
-        return results
+        Args:
+            start_date_min: Filter for events starting after this date
+            end_date_max: Filter for events ending before this date
+            tag_id: Filter by tag ID
+            limit: Page size
+            max_workers: Number of concurrent page requests
+            extra_params: Any other query params
+
+        Returns:
+            List of unique events (first occurrence wins).
+        """
+        query_params = {
+            k: v for k, v in {
+                "closed": "true",
+                "ascending": "true",
+                "start_date_min": start_date_min,
+                "end_date_max": end_date_max,
+                "tag_id": tag_id,
+                **extra_params,
+            }.items() if v is not None
+        }
+
+        total = self.probe_count(**query_params)
+        cache_dir = self._query_cache_dir(**query_params)
+        self._client._ensure_dir(cache_dir)
+
+        by_id: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                offset: executor.submit(
+                    self._fetch_page, cache_dir, limit=limit, offset=offset, **query_params
+                )
+                for offset in range(0, total, limit)
+            }
+            for offset, future in futures.items():
+                page = future.result()
+                expected = min(limit, total - offset)
+                got = len(page)
+                # Top up short pages; overlap with the next page is removed by the id dedup
+                while page and got < expected:
+                    logger.debug(f"Short page at offset={offset} ({got}/{expected}); refetching from {offset + got}.")
+                    for ev in page:
+                        by_id.setdefault(str(ev.get("id")), ev)
+                    page = self._fetch_page(cache_dir, limit=limit, offset=offset + got, **query_params)
+                    got += len(page)
+                for ev in page:
+                    by_id.setdefault(str(ev.get("id")), ev)
+
+        logger.info(f"Total closed events fetched: {len(by_id)}")
+        return list(by_id.values())
+
+    def fetch_all_frame(
+        self,
+        start_date_min: Optional[str] = None,
+        end_date_max: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        limit: int = 1000,
+        **extra_params: Any,
+    ):
+        """Like fetch_all(), but returns a pandas DataFrame with one row per event.
+
+        The frame is built once from all pages and duplicate ids are dropped with
+        a vectorized `duplicated()` on the id column instead of Python set checks.
+
+        Returns:
+            pandas.DataFrame of unique events (first occurrence wins); rows
+            are returned as-is if the events carry no id.
+        """
+        import pandas as pd
+
+        pages = self.iter_events(
+            limit=limit,
+            closed=True,
+            start_date_min=start_date_min,
+            end_date_max=end_date_max,
+            tag_id=tag_id,
+            batch=True,
+            **extra_params,
+        )
+        frame = pd.DataFrame.from_records(chain.from_iterable(pages))
+        if frame.empty:
+            return frame
+
+        # Events without an id (e.g. a projected response) leave nothing to dedupe on
+        if "id" in frame.columns:
+            frame = frame.loc[~frame["id"].astype(str).duplicated()].reset_index(drop=True)
+        logger.info(f"Total closed events fetched: {len(frame)}")
+        return frame
@@ -7,6 +7,7 @@ This module provides the main public API for fetching Polymarket data with:
 
 Public API:
     DataCollection.closed_events() - Fetch closed markets/events
+    DataCollection.closed_events_iter() - Stream closed events one at a time
     DataCollection.price_history() - Fetch price history for a market
     DataCollection.filter_by_categories() - Client-side tag filtering
     DataCollection.preview_size() - Estimate data size before pulling
@@ -21,25 +22,142 @@ Target research: calibration of final market probabilities and price analysis.
 
 from __future__ import annotations
 
-import json
+import heapq
+import io
 import logging
+import math
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Literal, Iterable, Dict, Any, List
+from typing import Optional, Literal, Iterable, Iterator, Dict, Any, List
 from difflib import get_close_matches
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+import orjson
+
+try:
+    # Optional C++ implementation of the fuzzy field-name fallback
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
+
+try:
+    # Optional C parser for ISO 8601 timestamps; accepts the 'Z' suffix directly
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 from .api_client import APIClient
+from .arrays import TradeArray
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _normalize_keys(keys: tuple) -> tuple:
+    """Pair each key with its lowercased, underscore-free form.
+
+    Events from one fetch share a handful of schemas, so caching on the key
+    tuple means each schema is normalized once instead of on every lookup.
+    """
+    return tuple((key, key.lower().replace('_', '')) for key in keys)
+
+
+@lru_cache(maxsize=256)
+def _search_name(field_name: str) -> str:
+    """Normalized form of a requested field name (cached per name)."""
+    return field_name.lower().replace(' ', '').replace('_', '')
+
+
+@lru_cache(maxsize=1024)
+def _is_date_key(key: str) -> bool:
+    """Whether values under `key` should be parsed as dates (cached per key)."""
+    lowered = key.lower()
+    return 'date' in lowered or 'time' in lowered
+
+
+@lru_cache(maxsize=1024)
+def _field_keys(keys: tuple, fields: tuple, fuzzy: bool) -> tuple:
+    """Resolve the key extract_fields() reads for each field of a dict schema.
+
+    One walk over the keys classifies each against every requested field,
+    keeping the first key in sorted order (what get_field() returns).
+
+    Returns:
+        Tuple parallel to `fields` of matching keys (None where nothing matches).
+    """
+    targets = {field: _search_name(field) for field in fields}
+
+    chosen: Dict[str, Optional[str]] = dict.fromkeys(targets)
+    for key, key_normalized in _normalize_keys(keys):
+        for field, search_name in targets.items():
+            if key_normalized == search_name or (fuzzy and search_name in key_normalized):
+                current = chosen[field]
+                if current is None or key < current:
+                    chosen[field] = key
+
+    for field, key in chosen.items():
+        if key is None and fuzzy:
+            close_matches = _close_matches(field, keys, n=5, cutoff=0.7)
+            chosen[field] = min(close_matches) if close_matches else None
+
+    return tuple(chosen[field] for field in fields)
+
+
+def _close_matches(word: str, possibilities: Iterable[str], n: int, cutoff: float) -> List[str]:
+    """difflib.get_close_matches(), scored by rapidfuzz when it is installed."""
+    if process is None:
+        return get_close_matches(word, possibilities, n=n, cutoff=cutoff)
+    return [
+        match for match, _, _ in
+        process.extract(word, list(possibilities), scorer=fuzz.ratio, score_cutoff=cutoff * 100, limit=n)
+    ]
+
+
+def _intern_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the categorical strings of an event in place.
+
+    Categories, tag labels/slugs and market outcome lists repeat across
+    thousands of events; interning keeps one copy of each in memory.
+    """
+    if isinstance(category := event.get('category'), str):
+        event['category'] = sys.intern(category)
+    for tag in event.get('tags') or ():
+        for key in ('label', 'slug'):
+            if isinstance(value := tag.get(key), str):
+                tag[key] = sys.intern(value)
+    for market in event.get('markets') or ():
+        if isinstance(outcomes := market.get('outcomes'), str):
+            market['outcomes'] = sys.intern(outcomes)
+    return event
+
+
+# Deletes quotes and brackets from stringified clobTokenIds lists
+_CLOB_STRIP = str.maketrans('', '', '"\'[]')
+
+# One price point in the HFT chunk log: timestamp, price, and the offset (s) it was sampled at
+_HFT_RECORD = np.dtype([('t', '<i8'), ('p', '<f8'), ('offset', 'i1')])
+
+
 class DataCollection:
     # Guardrail thresholds
     # Require force for larger spans
     MAX_DAYS_WITHOUT_FORCE = 120          
     # Soft cap on number of events loaded into RAM
     MAX_EVENTS_JSON_DEFAULT = 200_000     
+    # Price point count above which deduplication switches to NumPy
+    VECTORIZE_DEDUP_THRESHOLD = 100_000
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _client(cls) -> APIClient:
+        """Shared APIClient, so repeated calls reuse its pooled session and caches."""
+        return APIClient()
 
     @staticmethod
     def _to_iso(dt: Optional[datetime]) -> Optional[str]:
@@ -50,12 +168,9 @@ class DataCollection:
         return iso + ("Z" if not iso.endswith("Z") else "")
 
     @classmethod
-    def _validate_range(cls, start_iso: Optional[str], end_iso: Optional[str], force_large: bool) -> None:
-        if not start_iso or not end_iso:
+    def _validate_range(cls, start: Optional[datetime], end: Optional[datetime], force_large: bool) -> None:
+        if start is None or end is None:
             return
-        
-        start = datetime.fromisoformat(start_iso.replace("Z", ""))
-        end = datetime.fromisoformat(end_iso.replace("Z", ""))
 
         # Calculate span in days and enforce guardrail
         days = (end - start).days + 1
@@ -76,6 +191,7 @@ class DataCollection:
         force_large: bool = False,
         mode: Literal["json", "cache", "both"] = "json",
         closed: Optional[bool] = True,
+        prefetch: int = 2,
         **extra_params: Any,
     ) -> List[Dict[str, Any]]:
         """Fetch closed events (uses automatic caching).
@@ -86,18 +202,20 @@ class DataCollection:
             tag_id: Optional filter for a category/tag.
             limit: Page size requested from API.
             max_pages: Optional cap on pagination iterations.
+            prefetch: Pages requested ahead on worker threads while the current
+                one is consumed, hiding per-page latency (0 = sequential).
 
         Returns:
             List of event dictionaries.
         """
 
+        cls._validate_range(start_date_min, end_date_max, force_large)
+
         start_iso = cls._to_iso(start_date_min)
         end_iso = cls._to_iso(end_date_max)
 
-        cls._validate_range(start_iso, end_iso, force_large)
-
         # Create client and fetch (caching is handled automatically)
-        client = APIClient()
+        client = cls._client()
         
         events: List[Dict[str, Any]] = []
 
@@ -112,65 +230,237 @@ class DataCollection:
             "ascending": "true",
             "max_pages": max_pages,
             "batch": True,  # Get full pages at once for better performance
+            "prefetch": prefetch,
         }
         
         # Check for consolidated cache file (fast path)
-        query_params = {k: v for k, v in iter_params.items() if k not in ['offset', 'limit', 'batch', 'max_pages']}
+        query_params = {k: v for k, v in iter_params.items() if k not in ['offset', 'limit', 'batch', 'max_pages', 'prefetch']}
         cache_path = client._cache_path('fetch_closed_markets', **query_params)
-        consolidated_file = cache_path / "consolidated.json"
-        progress_file = cache_path / "progress.json"
+        consolidated_file = cache_path / "consolidated.jsonl"
         
         # If consolidated cache exists and fetch is complete, load it directly
-        if consolidated_file.exists() and progress_file.exists():
+        cached_events = client.closed_events._load_consolidated(cache_path)
+        if cached_events is not None:
+            logger.info(f"Loaded {len(cached_events)} events from consolidated cache in {cache_path}")
+            return cached_events
+
+        # Normal iteration path - fetch from individual offset files or API.
+        # Pages are appended to a temporary JSON-Lines file as they arrive and
+        # renamed into place only once the loop finishes cleanly.
+        consolidate = mode in ("json", "both")
+        tmp_file = consolidated_file.with_name(consolidated_file.name + ".tmp")
+        sink = None
+        if consolidate:
             try:
-                progress_data = json.loads(progress_file.read_text())
-                is_complete = progress_data.get("is_complete", False)
-                
-                if is_complete:
-                    logger.info(f"Loading from consolidated cache: {consolidated_file}")
-                    events = json.loads(consolidated_file.read_text())
-                    logger.info(f"Loaded {len(events)} events from consolidated cache")
-                    return events
-            except Exception as e:
-                logger.warning(f"Failed to load consolidated cache: {e}. Falling back to normal iteration.")
+                client._ensure_dir(cache_path)
+                sink = open(tmp_file, 'wb')
+            except OSError as e:
+                logger.warning(f"Failed to open consolidated cache {tmp_file}: {e}")
 
-        # Normal iteration path - fetch from individual offset files or API
-        for page in client.closed_events.iter_events(**iter_params):
-            if mode in ("json", "both"):
-                events.extend(page)  # Extend with full page
+        # Offset pagination can repeat an event across a page boundary when
+        # the result set shifts mid-fetch; keep the first copy only
+        seen_ids: set = set()
+
+        try:
+            for page in client.closed_events.iter_events(**iter_params):
+                if consolidate:
+                    fresh = []
+                    for ev in page:
+                        ev_id = ev.get('id')
+                        if ev_id is not None:
+                            if ev_id in seen_ids:
+                                continue
+                            seen_ids.add(ev_id)
+                        fresh.append(_intern_event(ev))
+                    page = fresh
+                    events.extend(page)  # Extend with full page
+
+                    if sink is not None and page:
+                        try:
+                            sink.write(b'\n'.join(orjson.dumps(ev) for ev in page) + b'\n')
+                        except OSError as e:
+                            logger.warning(f"Failed to write consolidated cache {tmp_file}: {e}")
+                            sink.close()
+                            sink = None
+                            tmp_file.unlink(missing_ok=True)
+
+                if len(events) >= cls.MAX_EVENTS_JSON_DEFAULT and not force_large and consolidate:
+                    raise ValueError(
+                        f"Event accumulation exceeded {cls.MAX_EVENTS_JSON_DEFAULT}. "
+                        "The date range is too large. Pass force_large=True to override."
+                    )
+        except BaseException:
+            if sink is not None:
+                sink.close()
+                tmp_file.unlink(missing_ok=True)
+            raise
+
+        if sink is None:
+            return events
+
+        # Publish the consolidated cache if we successfully fetched all events.
+        # The cache can be regenerated, so only durable clients pay for a sync;
+        # the rename keeps readers from seeing a half-written file and the
+        # recorded size/count lets a truncated file be detected on load.
+        try:
+            sink.flush()
+            if client.durable_cache:
+                client._datasync(sink.fileno())
+            size = sink.tell()
+            sink.close()
+            if not events:
+                tmp_file.unlink(missing_ok=True)
+                return events
+
+            logger.info(f"Saving consolidated cache with {len(events)} events to {consolidated_file}")
+            os.replace(tmp_file, consolidated_file)
+
+            # Mark the query as complete
+            client.closed_events._mark_complete(cache_path, len(events), size)
+
+        except Exception as e:
+            logger.warning(f"Failed to save consolidated cache: {e}")
 
-            if len(events) >= cls.MAX_EVENTS_JSON_DEFAULT and not force_large and mode in ("json", "both"):
-                raise ValueError(
-                    f"Event accumulation exceeded {cls.MAX_EVENTS_JSON_DEFAULT}. "
-                    "The date range is too large. Pass force_large=True to override."
-                )
-        
-        # Save consolidated cache if we successfully fetched all events
-        if events and mode in ("json", "both"):
-            try:
-                cache_path.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Saving consolidated cache with {len(events)} events to {consolidated_file}")
-                
-                # Write consolidated file with fsync
-                with open(consolidated_file, 'w') as f:
-                    json.dump(events, f, indent=2)
-                    f.flush()
-                    os.fsync(f.fileno())
-                
-                # Mark progress as complete
-                if progress_file.exists():
-                    progress_data = json.loads(progress_file.read_text())
-                    progress_data["is_complete"] = True
-                    with open(progress_file, 'w') as f:
-                        json.dump(progress_data, f)
-                        f.flush()
-                        os.fsync(f.fileno())
-                        
-            except Exception as e:
-                logger.warning(f"Failed to save consolidated cache: {e}")
-        
         return events
 
+    @classmethod
+    def closed_events_iter(
+        cls,
+        start_date_min: datetime,
+        end_date_max: Optional[datetime] = None,
+        tag_id: Optional[int] = None,
+        limit: int = 1000,
+        max_pages: Optional[int] = None,
+        force_large: bool = False,
+        closed: Optional[bool] = True,
+        prefetch: int = 2,
+        **extra_params: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream closed events one at a time (uses automatic caching).
+
+        A completed query is streamed line by line from its consolidated
+        JSON-Lines cache, so peak memory is one event rather than the whole
+        file; otherwise events are yielded page by page as they are fetched.
+        The MAX_EVENTS_JSON_DEFAULT cap does not apply since nothing is
+        accumulated.
+
+        Args:
+            start_date_min: Start date for closed events (required).
+            end_date_max: End date for closed events (optional).
+            tag_id: Optional filter for a category/tag.
+            limit: Page size requested from API.
+            max_pages: Optional cap on pagination iterations.
+            force_large: Override guardrails for large pulls.
+            closed: Filter for closed markets/events.
+            prefetch: Pages requested ahead while the current one is consumed
+                (0 = sequential).
+
+        Yields:
+            Event dictionaries.
+        """
+        cls._validate_range(start_date_min, end_date_max, force_large)
+
+        start_iso = cls._to_iso(start_date_min)
+        end_iso = cls._to_iso(end_date_max)
+
+        client = cls._client()
+
+        query_params = {
+            "closed": str(closed).lower(),
+            "start_date_min": start_iso,
+            "end_date_max": end_iso,
+            "tag_id": tag_id,
+            "ascending": "true",
+            **extra_params,
+        }
+        cache_path = client._cache_path('fetch_closed_markets', **query_params)
+
+        consolidated_file = client.closed_events._consolidated_file(cache_path)
+        if consolidated_file is not None and max_pages is None:
+            logger.info(f"Streaming events from consolidated cache {consolidated_file}")
+            yield from client.closed_events._iter_consolidated(consolidated_file)
+            return
+
+        for page in client.closed_events.iter_events(
+            limit=limit, offset=0, max_pages=max_pages, batch=True, prefetch=prefetch, **query_params
+        ):
+            yield from page
+
+    @classmethod
+    def closed_events_immutable(
+        cls,
+        start_date_min: datetime,
+        end_date_max: datetime,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Fetch closed events for a window that has already ended.
+
+        Events that closed in the past can't change, so their cache never goes
+        stale and the size guardrails only get in the way: this is
+        closed_events(closed=True, force_large=True), guarded instead by
+        requiring `end_date_max` to lie in the past. A window fetched before
+        is served straight from its consolidated cache.
+
+        Args:
+            start_date_min: Start date for closed events (required).
+            end_date_max: End date; must be before now (naive datetimes are UTC).
+            kwargs: Passed to closed_events() (tag_id, limit, mode, ...).
+
+        Returns:
+            List of event dictionaries.
+        """
+        end = end_date_max if end_date_max.tzinfo else end_date_max.replace(tzinfo=timezone.utc)
+        if end >= datetime.now(timezone.utc):
+            raise ValueError(
+                f"end_date_max {end_date_max} is not in the past; use closed_events() for open windows."
+            )
+
+        kwargs.update(closed=True, force_large=True)
+        return cls.closed_events(start_date_min=start_date_min, end_date_max=end_date_max, **kwargs)
+
+    @classmethod
+    def preview_size(
+        cls,
+        start_date_min: datetime,
+        end_date_max: Optional[datetime] = None,
+        tag_id: Optional[int] = None,
+        limit: int = 1000,
+        closed: Optional[bool] = True,
+        **extra_params: Any,
+    ) -> Dict[str, Any]:
+        """Estimate how many events a closed_events() call would pull.
+
+        Counts matching events with limit=1 probes instead of fetching pages,
+        so it is safe to call on ranges that would trip the guardrails.
+
+        Args:
+            start_date_min: Start date for closed events (required).
+            end_date_max: End date for closed events (optional).
+            tag_id: Optional filter for a category/tag.
+            limit: Page size the real fetch would use (for the page estimate).
+            closed: Filter for closed markets/events.
+
+        Returns:
+            Dict with the event count, page count, and whether the pull would
+            exceed MAX_EVENTS_JSON_DEFAULT without force_large.
+        """
+        client = cls._client()
+
+        count = client.closed_events.probe_count(
+            closed=str(closed).lower(),
+            ascending="true",
+            start_date_min=cls._to_iso(start_date_min),
+            end_date_max=cls._to_iso(end_date_max),
+            tag_id=tag_id,
+            **extra_params,
+        )
+
+        return {
+            "events": count,
+            "pages": math.ceil(count / limit),
+            "exceeds_json_limit": count > cls.MAX_EVENTS_JSON_DEFAULT,
+        }
+
     @staticmethod
     def _page_iter(client: APIClient, **params: Any) -> Iterable[List[Dict[str, Any]]]:
         """Internal helper yielding raw pages (list-of-events) without flattening."""
@@ -193,6 +483,52 @@ class DataCollection:
             yield buffer
 
 
+    @classmethod
+    def _dedupe_by_timestamp(cls, points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop repeated timestamps (first point wins) and sort by `t`.
+
+        Above VECTORIZE_DEDUP_THRESHOLD points the sort and duplicate scan run
+        in NumPy on an int64 timestamp array instead of per-dict Python work.
+        """
+        if len(points) > cls.VECTORIZE_DEDUP_THRESHOLD:
+            points = [point for point in points if point.get('t') is not None]
+            ts = np.fromiter((point['t'] for point in points), dtype=np.int64, count=len(points))
+            # Sorted unique timestamps and the index of each one's first occurrence,
+            # from a single stable sort done inside NumPy
+            _, first = np.unique(ts, return_index=True)
+            return [points[i] for i in first.tolist()]
+
+        by_ts: Dict[Any, Dict[str, Any]] = {}
+        for point in points:
+            t = point.get('t')
+            if t is not None:
+                by_ts.setdefault(t, point)
+        return sorted(by_ts.values(), key=itemgetter('t'))
+
+    @staticmethod
+    def _merge_chunks(chunks: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge per-chunk price lists into one sorted list without repeated timestamps.
+
+        Chunks come back time-ordered, so a k-way heapq.merge replaces the
+        concatenate-then-sort; sorting each chunk first is linear when it is
+        already ordered. The merge is stable, so as in _dedupe_by_timestamp the
+        first point (in chunk order) for each timestamp wins.
+        """
+        by_t = itemgetter('t')
+        ordered = [
+            sorted((point for point in chunk if point.get('t') is not None), key=by_t)
+            for chunk in chunks
+        ]
+
+        unique_prices = []
+        prev_t = None
+        for point in heapq.merge(*ordered, key=by_t):
+            t = point['t']
+            if t != prev_t:
+                unique_prices.append(point)
+                prev_t = t
+        return unique_prices
+
     @classmethod
     def price_history(
         cls,
@@ -203,7 +539,9 @@ class DataCollection:
         fidelity: Optional[int] = None,
         max_bars: Optional[int] = None,
         chunk_days: int = 7,
-    ) -> List[Dict[str, Any]]:
+        max_workers: int = 4,
+        as_array: bool = False,
+    ) -> List[Dict[str, Any]] | TradeArray:
         """Fetch price history for a specific market from CLOB endpoint.
         
         This method supports 4 mutually exclusive modes for specifying time ranges:
@@ -236,9 +574,13 @@ class DataCollection:
             max_bars: Maximum number of bars (Mode 3-4)
             market_start_date: Market start date (Mode 4)
             chunk_days: Size of chunks in days for paginated requests (default 7)
+            max_workers: Number of chunks fetched concurrently (default 4)
+            as_array: Return a columnar TradeArray (int64 ts, float32 price)
+                instead of a list of {"t", "p"} dicts; far smaller for long
+                minute-level windows
             
         Returns:
-            List of price datapoints
+            List of price datapoints, or a TradeArray if as_array
             
         Raises:
             ValueError: If parameters don't match one of the 4 mutually exclusive modes
@@ -277,7 +619,7 @@ class DataCollection:
         """
         from datetime import datetime, timezone
         
-        client = APIClient()
+        client = cls._client()
         
         # Validate mutually exclusive modes
         mode_indicators = [
@@ -337,19 +679,23 @@ class DataCollection:
                 interval=interval,
                 fidelity=fidelity,
                 use_cache=True,
+                as_array=as_array,
             )
-            return response.get('history', [])
+            return response if as_array else response.get('history', [])
         
         # Chunk large time ranges to avoid API limits
-        all_prices = []
         chunk_seconds = chunk_days * 24 * 3600
+        windows = []
         current_start = start_ts
-        
-        logger.info(f"Fetching price history for market {market} in {chunk_days}-day chunks")
-        
         while current_start < end_ts:
             current_end = min(current_start + chunk_seconds, end_ts)
-            
+            windows.append((current_start, current_end))
+            current_start = current_end
+        
+        logger.info(f"Fetching price history for market {market} in {chunk_days}-day chunks")
+
+        def fetch_chunk(window):
+            current_start, current_end = window
             try:
                 response = client.trades.fetch_prices(
                     market=market,
@@ -361,43 +707,67 @@ class DataCollection:
                 )
                 
                 chunk_data = response.get('history', []) if isinstance(response, dict) else response
-                all_prices.extend(chunk_data)
                 
                 logger.debug(
                     f"Fetched {len(chunk_data)} points for [{current_start}, {current_end})"
                 )
+                return chunk_data
                 
             except Exception as e:
                 logger.warning(
                     f"Failed to fetch chunk [{current_start}, {current_end}): {e}"
                 )
                 # Continue to next chunk
-            
-            current_start = current_end
+                return []
+
+        # Chunks are fetched concurrently but kept in time order for the merge
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            chunks = list(executor.map(fetch_chunk, windows))
         
         # Deduplicate and sort
-        if all_prices:
-            seen_timestamps = set()
-            unique_prices = []
-            
-            for point in all_prices:
-                t = point.get('t')
-                if t is not None and t not in seen_timestamps:
-                    seen_timestamps.add(t)
-                    unique_prices.append(point)
-            
-            unique_prices.sort(key=lambda x: x['t'])
+        if any(chunks):
+            unique_prices = cls._merge_chunks(chunks)
             
             logger.info(
                 f"Price history fetch complete: {len(unique_prices)} unique points "
-                f"(from {len(all_prices)} total fetched)"
+                f"(from {sum(map(len, chunks))} total fetched)"
             )
             
-            return unique_prices
+            return client.trades._as_array(unique_prices) if as_array else unique_prices
         
-        return []
+        return client.trades._as_array([]) if as_array else []
         return response.get('history', [])
     
+    @staticmethod
+    def _read_hft_index(index_file: Path, log_file: Path) -> Dict[tuple, tuple]:
+        """Map each completed HFT chunk window to its byte range in the record log.
+
+        Index lines are `[start, end, begin, stop]`. A trailing partial line and
+        log bytes past the last indexed window (left by an interrupted run) are
+        discarded so appends resume from a consistent state.
+        """
+        completed: Dict[tuple, tuple] = {}
+        indexed_end = 0
+        valid_bytes = 0
+        try:
+            with open(index_file, 'rb') as f:
+                for line in f:
+                    try:
+                        start, end, begin, stop = orjson.loads(line)
+                    except (orjson.JSONDecodeError, ValueError):
+                        break
+                    completed[(start, end)] = (begin, stop)
+                    indexed_end = max(indexed_end, stop)
+                    valid_bytes += len(line)
+        except FileNotFoundError:
+            return completed
+
+        if index_file.stat().st_size != valid_bytes:
+            os.truncate(index_file, valid_bytes)
+        if log_file.exists() and log_file.stat().st_size > indexed_end:
+            os.truncate(log_file, indexed_end)
+        return completed
+
     @classmethod
     def price_history_hft(
         cls,
@@ -407,6 +777,7 @@ class DataCollection:
         fidelity_seconds: int = 10,
         chunk_minutes: int = 24 * 60,
         force_use_api: bool = False,
+        max_workers: int = 4,
     ) -> List[Dict[str, Any]]:
         """Fetch high-frequency price history with sub-minute resolution.
         
@@ -418,6 +789,7 @@ class DataCollection:
                 Lower values = more API calls but higher resolution
             chunk_minutes: Time window per API call to respect rate limits
             force_use_api: If True, bypass cache and force API fetch
+            max_workers: Number of chunk windows fetched concurrently
                 
         Returns:
             List of price points sorted by timestamp, deduplicated
@@ -429,7 +801,7 @@ class DataCollection:
         if end_ts <= start_ts:
             raise ValueError("end_ts must be greater than start_ts")
         
-        client = APIClient()
+        client = cls._client()
         
         # Build cache path for the HFT result
         cache_path = client._cache_path(
@@ -440,18 +812,32 @@ class DataCollection:
             fidelity_seconds=fidelity_seconds,
             chunk_minutes=chunk_minutes
         )
-        cache_path.mkdir(parents=True, exist_ok=True)
-        cache_file = cache_path / "prices.json"
+        client._ensure_dir(cache_path)
+        # Columnar t/p arrays; prices.json is the older format, still read if present
+        cache_file = cache_path / "prices.npz"
+        legacy_cache_file = cache_path / "prices.json"
         
         # Check cache first unless force_use_api
         if not force_use_api and cache_file.exists():
             try:
                 logger.info(f"Loading HFT prices from cache: {cache_file}")
-                cached_data = json.loads(cache_file.read_text(encoding="utf-8"))
+                with np.load(cache_file) as columns:
+                    cached_data = [
+                        {'t': t, 'p': p}
+                        for t, p in zip(columns['t'].tolist(), columns['p'].tolist())
+                    ]
                 logger.info(f"Loaded {len(cached_data)} cached price points")
                 return cached_data
             except Exception as e:
                 logger.warning(f"Failed to load cache at {cache_file}: {e}. Refetching.")
+        elif not force_use_api and legacy_cache_file.exists():
+            try:
+                logger.info(f"Loading HFT prices from cache: {legacy_cache_file}")
+                cached_data = orjson.loads(legacy_cache_file.read_bytes())
+                logger.info(f"Loaded {len(cached_data)} cached price points")
+                return cached_data
+            except Exception as e:
+                logger.warning(f"Failed to load cache at {legacy_cache_file}: {e}. Refetching.")
         
         all_prices = []
 
@@ -462,6 +848,9 @@ class DataCollection:
             f"effective resolution={fidelity_seconds}s"
         )
 
+        # Every (offset, chunk) window is independent, so missing ones are
+        # fetched on a thread pool
+        windows = []
         for offset_idx in range(num_offsets):
             offset_seconds = offset_idx * fidelity_seconds
             
@@ -469,44 +858,86 @@ class DataCollection:
             
             while current_start < end_ts:
                 current_end = min(current_start + (chunk_minutes * 60), end_ts)
+                windows.append((offset_seconds, current_start, current_end))
+                current_start = current_end
+
+        # All chunk windows of a market share one append-only record log plus an
+        # index of completed windows, instead of one small cache file per chunk
+        chunk_dir = client._cache_path('hft_chunks', market=market)
+        client._ensure_dir(chunk_dir)
+        log_file = chunk_dir / "log.bin"
+        index_file = chunk_dir / "index.jsonl"
+        completed = cls._read_hft_index(index_file, log_file)
+        todo = [window for window in windows if window[1:] not in completed]
+        if len(todo) < len(windows):
+            logger.info(f"Reusing {len(windows) - len(todo)} cached chunk windows from {log_file}")
+
+        def fetch_window(window):
+            offset_seconds, current_start, current_end = window
+            try:
+                response = client.trades.fetch_prices(
+                    market=market,
+                    startTs=current_start,
+                    endTs=current_end,
+                    fidelity=1, 
+                    use_cache=False,
+                    save=False,  # the window is stored in log.bin instead
+                )
+                
+                chunk_data = response.get('history', []) if isinstance(response, dict) else response
                 
+                logger.debug(
+                    f"Offset {offset_seconds}s: fetched {len(chunk_data)} points "
+                    f"for [{current_start}, {current_end})"
+                )
+                return chunk_data
+                
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch offset={offset_seconds}s, "
+                    f"range=[{current_start}, {current_end}): {e}"
+                )
+                return None
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor, \
+                client._open_append(log_file) as log, client._open_append(index_file) as index:
+            for window, chunk_data in zip(todo, executor.map(fetch_window, todo)):
+                if chunk_data is None:
+                    continue
+                fetched[window] = chunk_data
                 try:
-                    response = client.trades.fetch_prices(
-                        market=market,
-                        startTs=current_start,
-                        endTs=current_end,
-                        fidelity=1, 
-                        use_cache=True,
-                    )
-                    
-                    chunk_data = response.get('history', []) if isinstance(response, dict) else response
-                    all_prices.extend(chunk_data)
-                    
-                    logger.debug(
-                        f"Offset {offset_seconds}s: fetched {len(chunk_data)} points "
-                        f"for [{current_start}, {current_end})"
+                    records = np.array(
+                        [(point['t'], point['p'], window[0]) for point in chunk_data],
+                        dtype=_HFT_RECORD,
                     )
-                    
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to fetch offset={offset_seconds}s, "
-                        f"range=[{current_start}, {current_end}): {e}"
-                    )
-                
-                current_start = current_end
+                    begin = log.tell()
+                    log.write(records.tobytes())
+                    log.flush()
+                    index.write(orjson.dumps([window[1], window[2], begin, log.tell()]) + b'\n')
+                    index.flush()
+                except (KeyError, TypeError, ValueError, OSError) as e:
+                    logger.warning(f"Failed to log chunk [{window[1]}, {window[2]}) to {log_file}: {e}")
+
+        log_records = None
+        if len(todo) < len(windows) and log_file.stat().st_size:
+            log_records = np.memmap(log_file, dtype=_HFT_RECORD, mode='r',
+                                    shape=(log_file.stat().st_size // _HFT_RECORD.itemsize,))
+
+        # Collect in window order so deduplication keeps the same point a serial loop would
+        for window in windows:
+            if window in fetched:
+                all_prices.extend(fetched[window])
+            elif log_records is not None and window[1:] in completed:
+                begin, end = completed[window[1:]]
+                records = log_records[begin // _HFT_RECORD.itemsize:end // _HFT_RECORD.itemsize]
+                all_prices.extend(
+                    {'t': t, 'p': p} for t, p in zip(records['t'].tolist(), records['p'].tolist())
+                )
+        del log_records
         
         if all_prices:
-            seen_timestamps = set()
-            unique_prices = []
-            
-            for point in all_prices:
-                t = point.get('t')
-                if t is not None and t not in seen_timestamps:
-                    seen_timestamps.add(t)
-                    unique_prices.append(point)
-            
-            # Sort by timestamp
-            unique_prices.sort(key=lambda x: x['t'])
+            unique_prices = cls._dedupe_by_timestamp(all_prices)
             
             logger.info(
                 f"HFT fetch complete: {len(unique_prices)} unique points "
@@ -515,10 +946,16 @@ class DataCollection:
             
             # Save to cache
             try:
-                with open(cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(unique_prices, f, indent=2)
-                    f.flush()
-                    os.fsync(f.fileno())
+                buffer = io.BytesIO()
+                np.savez(
+                    buffer,
+                    t=np.fromiter((point['t'] for point in unique_prices), dtype=np.int64, count=len(unique_prices)),
+                    p=np.fromiter((point['p'] for point in unique_prices), dtype=np.float64, count=len(unique_prices)),
+                )
+                # Write beside the target and rename, so a crash never leaves a partial file
+                tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+                client._write_cache_file(tmp_file, buffer.getvalue())
+                os.replace(tmp_file, cache_file)
                 logger.info(f"Saved HFT prices to cache: {cache_file}")
             except Exception as e:
                 logger.warning(f"Failed to save cache at {cache_file}: {e}")
@@ -576,34 +1013,22 @@ class DataCollection:
         if not categories:
             return events
         
-        # Normalize categories for comparison
+        # Normalize categories for comparison; the normalizer is chosen once
         if not case_sensitive and match_field in ("label", "slug"):
-            normalized_cats = {str(cat).lower() for cat in categories}
+            normalize = lambda value: str(value).lower()
         else:
-            normalized_cats = {str(cat) for cat in categories}
+            normalize = str
+        normalized_cats = frozenset(normalize(cat) for cat in categories)
         
-        filtered = []
-        for event in events:
-            tags = event.get("tags", [])
-            if not tags:
-                continue
-            
-            for tag in tags:
-                tag_value = tag.get(match_field)
-                if tag_value is None:
-                    continue
-                
-                # Normalize for comparison
-                if not case_sensitive and match_field in ("label", "slug"):
-                    tag_value = str(tag_value).lower()
-                else:
-                    tag_value = str(tag_value)
-                
-                if tag_value in normalized_cats:
-                    filtered.append(event)
-                    break
-        
-        return filtered
+        # isdisjoint() consumes the tag values lazily and stops at the first match
+        return [
+            event for event in events
+            if not normalized_cats.isdisjoint(
+                normalize(tag_value)
+                for tag in event.get("tags") or ()
+                if (tag_value := tag.get(match_field)) is not None
+            )
+        ]
 
     @staticmethod
     def getClobTokenId(market: Dict[str, Any]) -> Optional[List[str]]:
@@ -630,8 +1055,8 @@ class DataCollection:
             return [str(token).strip() for token in clobTokenId if token]
         
         if isinstance(clobTokenId, str):
-            # Remove quotes and brackets
-            clobTokenId = clobTokenId.replace('"', '').replace("'", "").strip("[]")
+            # Remove quotes and brackets in one pass
+            clobTokenId = clobTokenId.translate(_CLOB_STRIP)
             
             # Split by comma if multiple tokens
             if ',' in clobTokenId:
@@ -658,7 +1083,7 @@ class DataCollection:
 
         if isinstance(value, str):
             try:
-                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+                return _parse_iso(value)
             except (ValueError, AttributeError):
                 return None
         
@@ -673,6 +1098,23 @@ class DataCollection:
         
         return None
 
+    @classmethod
+    def _clean_value(cls, key: str, value: Any, parse_dates: bool, parse_json: bool) -> Any:
+        """Parse a JSON-list string and/or a date value found under `key`."""
+        if parse_json and isinstance(value, str) and value.startswith('['):
+            try:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+        
+        # Parse dates
+        if parse_dates and _is_date_key(key):
+            parsed = cls._parse_date(value)
+            if parsed is not None:
+                value = parsed
+        
+        return value
+
     @classmethod
     def get_field(
         cls,
@@ -701,23 +1143,21 @@ class DataCollection:
         Returns:
             Field value (cleaned/parsed), or dict of all matches if return_all=True
         """
-        search_name = field_name.lower().replace(' ', '').replace('_', '')
+        search_name = _search_name(field_name)
         
         matches = {}
-        for key, value in data.items():
-            key_normalized = key.lower().replace('_', '')
-            
+        for key, key_normalized in _normalize_keys(tuple(data)):
             # Exact match (after normalization)
             if key_normalized == search_name:
-                matches[key] = value
+                matches[key] = data[key]
             # Fuzzy match in case of partial match
             elif fuzzy and search_name in key_normalized:
-                matches[key] = value
+                matches[key] = data[key]
         
         # No matches found
         if not matches:
             if fuzzy:
-                close_matches = get_close_matches(
+                close_matches = _close_matches(
                     field_name,
                     data.keys(),
                     n=5,
@@ -730,21 +1170,10 @@ class DataCollection:
             if not matches:
                 return default
         
-        cleaned_matches = {}
-        for key, value in matches.items():
-            if parse_json and isinstance(value, str) and value.startswith('['):
-                try:
-                    value = json.loads(value)
-                except json.JSONDecodeError:
-                    pass
-            
-            # Parse dates
-            if parse_dates and ('date' in key.lower() or 'time' in key.lower()):
-                parsed = cls._parse_date(value)
-                if parsed is not None:
-                    value = parsed
-            
-            cleaned_matches[key] = value
+        cleaned_matches = {
+            key: cls._clean_value(key, value, parse_dates, parse_json)
+            for key, value in matches.items()
+        }
         
         # Return based on return_all flag
         if return_all:
@@ -777,23 +1206,14 @@ class DataCollection:
         Returns:
             Dictionary mapping field names to extracted values
         """
-        result = {}
-
-        field_querry = {
-            'data': data,
-            'fuzzy': fuzzy,
-            'parse_dates': parse_dates,
-            'parse_json': parse_json,
-            'return_all': False,
-            'default': None
+        # Which key answers each field depends only on the dict's keys, so the
+        # resolution is cached per schema and each call is just lookups + parsing
+        chosen = _field_keys(tuple(data), tuple(fields), fuzzy)
+        return {
+            field: None if key is None else cls._clean_value(key, data[key], parse_dates, parse_json)
+            for field, key in zip(fields, chosen)
         }
 
-        for field in fields:
-            value = cls.get_field(field_name=field, **field_querry)
-            result[field] = value
-        
-        return result
-
 
     @classmethod
     def get_dates_from_event(cls, event: Dict[str, Any]) -> Dict[str, Optional[datetime]]:
@@ -19,19 +19,98 @@ other modules in this package.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import orjson
 import requests
 
+from .arrays import TradeArray
+
 logger = logging.getLogger(__name__)
 
 
+# Below this size mmap setup costs more than the copy it saves
+_MMAP_MIN_SIZE = 64_000
+
+
+def _read_plain_json(path: Path) -> tuple[Any, bool]:
+    """Parse an uncompressed cache file.
+
+    Returns:
+        (data, indented) where indented flags a pretty-printed legacy file.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+            # Parse straight from the page cache instead of copying the file first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+                return data, mm[1:2] == b"\n"
+        raw = f.read()
+        return orjson.loads(raw), raw[1:2] == b"\n"
+
+
+@lru_cache(maxsize=256)
+def _load_cached_json(path_str: str, mtime_ns: int) -> Any:
+    """Parse a cache file once per (path, mtime); rewriting the file invalidates it.
+
+    Top-level lists (and list values of a top-level dict) are stored as tuples;
+    callers must go through _thaw(), which copies the datapoint dicts too, so
+    nothing a caller mutates reaches the memoized value.
+    Files ending in .gz (written with compress_cache) are decompressed first.
+    """
+    path = Path(path_str)
+    if path.suffix == ".gz":
+        data, indented = orjson.loads(gzip.decompress(path.read_bytes())), False
+    else:
+        data, indented = _read_plain_json(path)
+    if indented:
+        # Indented file from an older version; rewrite it compact once. The
+        # compact copy is swapped in atomically so a concurrent reader or a
+        # crash never sees a truncated file.
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_bytes(orjson.dumps(data))
+            os.replace(tmp, path)
+        except OSError:
+            logger.debug("Failed to compact cache file %s", path)
+            tmp.unlink(missing_ok=True)
+    if isinstance(data, list):
+        return tuple(data)
+    if isinstance(data, dict):
+        return {k: tuple(v) if isinstance(v, list) else v for k, v in data.items()}
+    return data
+
+
+def _thaw_points(points: tuple) -> list:
+    return [dict(point) if isinstance(point, dict) else point for point in points]
+
+
+def _thaw(data: Any) -> Any:
+    """Private copy of a memoized cache value: fresh lists of fresh datapoint dicts."""
+    if isinstance(data, tuple):
+        return _thaw_points(data)
+    if isinstance(data, dict):
+        return {k: _thaw_points(v) if isinstance(v, tuple) else v for k, v in data.items()}
+    return data
+
+
 class TradesAPI:
     """API client for fetching price-history/trades from the CLOB endpoint."""
 
-    VALID_INTERVALS = {"1m", "1w", "1d", "6h", "1h", "max"}
+    VALID_INTERVALS: frozenset[str] = frozenset({"1m", "1w", "1d", "6h", "1h", "max"})
+    _VALID_INTERVALS_SORTED = tuple(sorted(VALID_INTERVALS))
+    # (connect, read) timeouts in seconds
+    TIMEOUT = (5, 20)
 
     def __init__(self, base_client):
         self._client = base_client
@@ -44,7 +123,10 @@ class TradesAPI:
         interval: Optional[str] = None,
         fidelity: Optional[int] = None,
         use_cache: bool = True,
-    ) -> List[Dict[str, Any]]:
+        as_array: bool = False,
+        revalidate: bool = False,
+        save: bool = True,
+    ) -> Any:
         """Fetch price history for a market from the public CLOB endpoint.
 
         Args:
@@ -53,10 +135,20 @@ class TradesAPI:
             endTs: End timestamp in milliseconds (optional).
             interval: Mutually exclusive with startTs/endTs. One of VALID_INTERVALS.
             fidelity: Resolution in minutes.
-            use_cache: Whether to read/write cached response files.
+            use_cache: Whether to return a cached response file if one exists.
+            as_array: Return the datapoints as a TradeArray (int64 ts from "t",
+                float32 price from "p") instead of the parsed JSON.
+            revalidate: With a cached response present, ask the server whether
+                it changed (If-None-Match / If-Modified-Since from the stored
+                ETag / Last-Modified) instead of returning it unconditionally.
+                A 304, or a failed request, reuses the cached body.
+            save: Write the fetched response to the cache (even when use_cache
+                is False, so a forced refetch still refreshes it). Pass False for
+                callers that keep the data elsewhere, like price_history_hft's
+                per-market log.
 
         Returns:
-            Parsed JSON response (list of datapoints) from the CLOB API.
+            Parsed JSON response from the CLOB API, or a TradeArray if as_array.
         """
         if not market:
             raise ValueError("market parameter is required")
@@ -65,36 +157,48 @@ class TradesAPI:
             raise ValueError("interval is mutually exclusive with startTs/endTs")
 
         if interval is not None and interval not in self.VALID_INTERVALS:
-            raise ValueError(f"interval must be one of {sorted(self.VALID_INTERVALS)}")
+            raise ValueError(f"interval must be one of {list(self._VALID_INTERVALS_SORTED)}")
 
-        params: Dict[str, Any] = {"market": market}
-        if startTs is not None:
-            params["startTs"] = startTs
-        if endTs is not None:
-            params["endTs"] = endTs
-        if interval is not None:
-            params["interval"] = interval
-        if fidelity is not None:
-            params["fidelity"] = fidelity
-
-        # Build cache path using stable params (exclude ephemeral fields if any)
-        cache_path = self._client._cache_path('trades', market=market, interval=interval, fidelity=fidelity)
-        cache_path.mkdir(parents=True, exist_ok=True)
+        params: Dict[str, Any] = {
+            k: v
+            for k, v in (("market", market), ("startTs", startTs), ("endTs", endTs),
+                         ("interval", interval), ("fidelity", fidelity))
+            if v is not None
+        }
 
-        # Create a filename for this param set
-        if interval is not None:
-            fname = f"interval_{interval}__fidelity_{fidelity or 'auto'}.json"
-        else:
-            fname = f"start_{startTs or 'none'}__end_{endTs or 'none'}__fidelity_{fidelity or 'auto'}.json"
+        # Build cache path using stable params (exclude ephemeral fields if any).
+        # With neither use_cache nor save nothing is read or written, so no
+        # directory is created
+        path: Optional[Path] = None
+        stored: Optional[Path] = None
+        if use_cache or save:
+            cache_path = self._client._cache_path('trades', market=market, interval=interval, fidelity=fidelity)
+            self._client._ensure_dir(cache_path)
+            path, stored = self._cache_file(cache_path, params)
 
-        path = cache_path / fname
+        def load_cached() -> Any:
+            data = _load_cached_json(str(stored), stored.stat().st_mtime_ns)
+            return self._as_array(data) if as_array else _thaw(data)
 
-        if use_cache and path.exists():
+        meta_path = path.with_suffix(".meta.json") if path is not None else None
+        headers: Dict[str, str] = {}
+        cached = use_cache and stored is not None
+        if cached and revalidate:
             try:
-                logger.info(f"Loading cached prices-history from {path}")
-                return __import__("json").loads(path.read_text(encoding="utf-8"))
+                meta = orjson.loads(meta_path.read_bytes())
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+            except (OSError, orjson.JSONDecodeError):
+                pass  # No validators stored; a plain GET refreshes the entry
+        elif cached:
+            try:
+                logger.info(f"Loading cached prices-history from {stored}")
+                return load_cached()
             except Exception:
                 logger.warning("Corrupted cache at %s, refetching", path)
+                cached = False
 
         logger.info("Fetching prices-history from API for market=%s", market)
 
@@ -102,29 +206,158 @@ class TradesAPI:
 
         logger.info(f"Fetching prices-history with params: {params}")
         try:
-            resp = requests.get(url, params=params, timeout=20)
+            self._client._throttle()
+            resp = self._client._session.get(url, params=params, headers=headers or None, timeout=self.TIMEOUT)
             resp.raise_for_status()
         except requests.RequestException as e:
+            if cached:
+                logger.warning("Revalidating %s failed (%s); using cached copy", path, e)
+                return load_cached()
+
             # Try to extract error message from response body
             error_detail = str(e)
-            try:
-                if hasattr(e, 'response') and e.response is not None:
-                    error_body = e.response.json()
-                    if 'error' in error_body:
+            if e.response is not None:
+                try:
+                    error_body = orjson.loads(e.response.content)
+                    if isinstance(error_body, dict) and 'error' in error_body:
                         error_detail = f"{e} - Server error: {error_body['error']}"
-            except Exception:
-                pass  # If we can't parse the error, just use the original
+                except orjson.JSONDecodeError:
+                    pass  # Error pages can be HTML; just use the original
             
             logger.error("Request to prices-history failed: %s", error_detail)
             raise RuntimeError(error_detail) from e
 
-        data = resp.json()
+        if resp.status_code == 304 and cached:
+            logger.info(f"prices-history unchanged, loading cached copy from {path}")
+            return load_cached()
+
+        # Parse the raw body once; those same bytes are what gets cached
+        raw = resp.content
+        data = orjson.loads(raw)
         logger.info(f"Received {len(data) if isinstance(data, list) else 'non-list'} datapoints from API")
 
         # Persist cache for reproducibility
-        try:
-            path.write_text(__import__("json").dumps(data, indent=2), encoding="utf-8")
-        except Exception:
-            logger.debug("Failed to write cache file %s", path)
+        if save:
+            try:
+                self._client._write_cache_file(path, raw, compress=self._client.compress_cache)
+                validators = {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+                if any(validators.values()):
+                    meta_path.write_bytes(orjson.dumps(validators))
+                if stored is None:
+                    with self._client._open_append(cache_path / "index.jsonl") as f:
+                        f.write(orjson.dumps({"file": path.name, "params": params}) + b"\n")
+            except Exception:
+                logger.debug("Failed to write cache file %s", path)
+
+        return self._as_array(data) if as_array else data
+
+    def _stored_variant(self, path: Path) -> Optional[Path]:
+        """The existing file for `path`: itself or its .gz form (compress_cache's preference first)."""
+        candidates = [self._client._compressed_path(path), path]
+        if not self._client.compress_cache:
+            candidates.reverse()
+        return next((candidate for candidate in candidates if candidate.exists()), None)
+
+    def _cache_file(self, cache_path: Path, params: Dict[str, Any]) -> tuple[Path, Optional[Path]]:
+        """Cache file for a param set inside the market's cache directory.
+
+        The name is a blake2b-128 digest of the sorted params, so it has a
+        fixed length however wide the timestamp range; index.jsonl in the same
+        directory maps each name back to its params. A file saved under the
+        older readable name is still used when present.
+
+        Returns:
+            (path, stored): where a fresh response is written (before any .gz
+            suffix), and the existing file to read, or None when nothing is
+            cached yet (the write then also needs an index entry).
+        """
+        key = orjson.dumps(sorted(params.items()))
+        path = cache_path / (hashlib.blake2b(key, digest_size=16).hexdigest() + ".json")
+        stored = self._stored_variant(path)
+        if stored is not None:
+            return path, stored
+
+        interval, fidelity = params.get("interval"), params.get("fidelity")
+        if interval is not None:
+            legacy = f"interval_{interval}__fidelity_{fidelity or 'auto'}.json"
+        else:
+            legacy = (f"start_{params.get('startTs') or 'none'}__end_{params.get('endTs') or 'none'}"
+                      f"__fidelity_{fidelity or 'auto'}.json")
+        stored = self._stored_variant(cache_path / legacy)
+        if stored is not None:
+            return cache_path / legacy, stored
+        return path, None
+
+    @staticmethod
+    def _as_array(data: Any) -> TradeArray:
+        """Columnar view of a prices-history response ({"history": [...]} or a bare list)."""
+        points = data.get("history", ()) if isinstance(data, dict) else data
+        array = TradeArray.from_dicts(points, ts_key="t", price_key="p")
+        # Prices are 0-1 probabilities quoted to a few digits; float32 holds them
+        # exactly enough and halves the memory of the columns
+        return TradeArray(
+            ts=array.ts,
+            size=array.size.astype(np.float32, copy=False),
+            price=array.price.astype(np.float32, copy=False),
+        )
+
+    @staticmethod
+    def extract_market_tokens(events: List[Dict[str, Any]]) -> List[str]:
+        """Collect the first CLOB token ID of every market in a list of events.
+
+        Gives fetch_prices_many() its input straight from closed-events data:
+        the primary (first-outcome) token is what price history is keyed by.
+
+        Args:
+            events: Event dicts as returned by DataCollection.closed_events().
+
+        Returns:
+            Token IDs in event/market order; markets without tokens are skipped.
+        """
+        # Imported here: data_collection imports the client, which loads this module
+        from .data_collection import DataCollection
+
+        parse = DataCollection.getClobTokenId
+        return [
+            tokens[0]
+            for event in events
+            for market in event.get('markets') or ()
+            if (tokens := parse(market))
+        ]
+
+    def fetch_prices_many(
+        self,
+        markets: List[str],
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Fetch price history for many markets concurrently.
+
+        Requests run on a thread pool over the client's pooled session and
+        still pass through its rate-limit throttle and the per-market cache.
+        Workers are capped at the session's POOL_MAXSIZE: past that, requests
+        can't reuse a kept-alive connection and each pays for a fresh TLS
+        handshake instead.
+
+        Args:
+            markets: Market identifiers to fetch.
+            max_workers: Number of concurrent requests (capped at POOL_MAXSIZE).
+            kwargs: Passed to fetch_prices() for every market (startTs, endTs,
+                interval, fidelity, use_cache, save).
+
+        Returns:
+            Dict mapping each market to its fetch_prices() result, or to the
+            exception raised for it, so one failure doesn't discard the rest.
+        """
+        def fetch(market: str) -> Any:
+            try:
+                return self.fetch_prices(market=market, **kwargs)
+            except Exception as e:
+                return e
 
-        return data
+        workers = max(1, min(max_workers, self._client.POOL_MAXSIZE))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(markets, executor.map(fetch, markets)))
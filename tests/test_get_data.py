@@ -1,10 +1,14 @@
 import sys
-from datetime import datetime, timezone, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import logging
 from pathlib import Path
-from datetime import datetime
 from typing import List, Dict, Any
 
+import numpy as np
+import pandas as pd
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(name)s - %(message)s')
 
@@ -12,6 +16,7 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(name)s - %(mes
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from polymarket.data_collection import DataCollection
+from polymarket.arrays import TradeArray
 
 print("Starting data fetch for closed events...")
 
@@ -20,20 +25,18 @@ end_date = datetime(2025, 12, 6, 0, 0, 0)
 
 print(f"Date range: {start_date} to {end_date}")
 
-curr_time = datetime.now()
-# Fetch closed events data - now always returns a list
-closed_events = DataCollection.closed_events(
+t0 = time.monotonic_ns()
+# Fetch closed events data - now always returns a list.
+# The window has already ended, so the guardrail-free immutable path applies
+closed_events = DataCollection.closed_events_immutable(
     start_date_min=start_date,
     end_date_max=end_date,
     #tag_id=84,
-    closed=True,
     limit=1000,
     #related_tags=True,
-    force_large=True,  # Bypass date range guardrail
 )
 
-end_time = datetime.now()
-print(f"{(end_time - curr_time)} ms")
+print(f"{(time.monotonic_ns() - t0) / 1e6:.2f} ms")
 
 print(f"Fetched {len(closed_events)} closed events.")
 if not closed_events:
@@ -49,122 +52,116 @@ print("\n" + "="*70)
 print("Fetching price history for first 5 events...")
 print("="*70)
 
-long_duration_markets = []
 long_duration = timedelta(days=7)
 
-for i, event in enumerate(closed_events, 1):
-    markets = event.get('markets', [])
-    for market in markets:
-        dates = DataCollection.extract_fields(market, ['startDate', 'endDate'])
-        start_date = dates.get('startDate')
-        end_date = dates.get('endDate')
-
-        #print(type(start_date), type(end_date))
-
-        if start_date and end_date:
-            duration = end_date - start_date
-            if duration >= long_duration:
-                long_duration_markets.append(event)
-                if len(long_duration_markets) == 5:
-                    break
+# One row per market, with its event's position, so the duration filter is one vectorized pass
+markets_df = pd.DataFrame(
+    [
+        (i, j, market.get('startDate'), market.get('endDate'))
+        for i, event in enumerate(closed_events)
+        for j, market in enumerate(event.get('markets') or ())
+    ],
+    columns=['event', 'market', 'startDate', 'endDate'],
+)
+
+# All ISO strings parsed at once into unix seconds; missing or invalid dates are masked out
+start_dt = pd.to_datetime(markets_df['startDate'], utc=True, errors='coerce', format='ISO8601')
+end_dt = pd.to_datetime(markets_df['endDate'], utc=True, errors='coerce', format='ISO8601')
+valid = (start_dt.notna() & end_dt.notna()).to_numpy()
+markets_df['start_ts'] = start_dt.to_numpy(dtype='datetime64[ns]').astype('datetime64[s]').astype(np.int64)
+markets_df['end_ts'] = end_dt.to_numpy(dtype='datetime64[ns]').astype('datetime64[s]').astype(np.int64)
+
+mask = valid & ((markets_df['end_ts'] - markets_df['start_ts']).to_numpy() >= long_duration.total_seconds())
+long_duration_rows = markets_df[mask].head(5)
+long_duration_markets = [closed_events[i] for i in long_duration_rows['event']]
     
 print(f"Found {len(long_duration_markets)} markets with duration >= {long_duration.days} days.")
 
 
-for i, event in enumerate(long_duration_markets[:1], 1):
-    print(f"\n[{i}/5] Event: {event['title']}")
-    
-    # Get markets from the event
-    markets = event.get('markets', [])
-    if not markets:
-        print("  No markets found in event")
+
+# Fidelity of the second and minute series
+fidelity_val_seconds = 30
+fidelity_val_minutes = 1
+
+
+jobs = []
+for i, row in enumerate(long_duration_rows.itertuples(index=False), 1):
+    event = closed_events[row.event]
+    market = event['markets'][row.market]
+    print(f"\n[{i}/{len(long_duration_rows)}] Event: {event['title']}")
+
+    # One pass over the market's keys for every field the loop needs
+    fields = DataCollection.extract_fields(market, ['clobTokenId', 'outcomes'])
+    clobTokenIds = fields['clobTokenId']
+    if not clobTokenIds:
+        print("  No clobTokenId found in market")
         continue
-    
-    for market in markets[:1]:
-        clobTokenIds = DataCollection.get_field(market, 'clobTokenId')
-        if not clobTokenIds:
-            print("  No clobTokenId found in market")
-            continue
-
-        clobTokenId = clobTokenIds[0]
-
-        print(f"  Fetching prices for Market ID: {clobTokenId}")
-        print(f"  Market Question: {market.get('question')}")
-
-        # Get outcomes
-        outcomes = DataCollection.get_field(market, 'outcomes')
-
-        print(f"  Outcomes: {outcomes}")
-
-        # Get start and end date in iso format as strings
-        dates = DataCollection.extract_fields(market, ['startDate', 'endDate'])
-        end_date = dates.get('endDate')
-        start_date = dates.get('startDate')
-
-        #end_date_str = market.get('endDate')
-        #start_date_str = market.get('startDate')
-
-        # Parse ISO format strings to datetime objects 
-        #end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00')) if end_date_str else None
-        #start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00')) if start_date_str else None
-
-        print(f"  Start Date: {start_date}, End Date: {end_date}")
-
-        # Example parameters for different modes
-        max_bars = 20
-        minutes = 120
-        fidelity_val_seconds = 30
-        fidelity_val_minutes = 1
-
-        try:
-            curr_time = datetime.now(timezone.utc)
-            
-            # MODE 3 EXAMPLE: Get last N bars ending at market end_date
-            # This fetches the last 'minutes' worth of data with specified fidelity
-            print(f"  Testing hft price history mode")
-            start_ts = int(start_date.timestamp())  # Start at market open
-            end_ts = int(end_date.timestamp())  # End at market close
-            
-            prices_seconds = []
-            prices_seconds = DataCollection.price_history_hft(
-                market=clobTokenId,
-                end_ts=end_ts,
-                start_ts=start_ts,
-                fidelity_seconds=fidelity_val_seconds,
-            )
 
-            prices_minute = DataCollection.price_history(
+    clobTokenId = clobTokenIds[0]
+
+    print(f"  Fetching prices for Market ID: {clobTokenId}")
+    print(f"  Market Question: {market.get('question')}")
+
+    print(f"  Outcomes: {fields['outcomes']}")
+    print(f"  Start Date: {row.startDate}, End Date: {row.endDate}")
+
+    # This fetches the whole market lifetime (open to close, already in unix seconds)
+    jobs.append((clobTokenId, int(row.start_ts), int(row.end_ts)))
+
+print(f"\n  Testing hft price history mode for {len(jobs)} markets")
+t0 = time.monotonic_ns()
+
+# Every (market, series) request goes into one pool as a single batch, so the
+# whole set overlaps instead of waiting market by market
+with ThreadPoolExecutor(max_workers=8) as executor:
+    batch = [
+        (
+            clobTokenId,
+            executor.submit(
+                DataCollection.price_history,
                 market=clobTokenId,
                 end_ts=end_ts,
                 start_ts=start_ts,
                 #interval="max",
                 fidelity=fidelity_val_minutes,
-            )
-            
-            end_time = datetime.now(timezone.utc)
-            print(f"received {len(prices_minute)} for minutes and {len(prices_seconds)} for seconds prices in {(end_time - curr_time)}")
-            
-            if prices_minute:
-                print(f"Fetched {len(prices_minute)} price datapoints")
-                if len(prices_minute) > 0:
-                    for price in prices_minute[:min(3, len(prices_minute))]:
-                        print(price)
-            else:
-                print(f"No price data returned")
-            
-            print("\n" + "-"*40 + "\n")
-
-            if prices_seconds:
-                print(f"Fetched {len(prices_seconds)} price datapoints")
-                if len(prices_seconds) > 0:
-                    for price in prices_seconds[:min(3, len(prices_seconds))]:
+                as_array=True,  # columnar ts/price arrays instead of one dict per minute
+            ),
+            executor.submit(
+                DataCollection.price_history_hft,
+                market=clobTokenId,
+                end_ts=end_ts,
+                start_ts=start_ts,
+                fidelity_seconds=fidelity_val_seconds,
+            ),
+        )
+        for clobTokenId, start_ts, end_ts in jobs
+    ]
+
+    for clobTokenId, minute_future, seconds_future in batch:
+        print(f"\n  Market ID: {clobTokenId}")
+
+        # Each series is checked on its own, so one failed request (e.g. a 429)
+        # doesn't discard the other results
+        for label, future in (("minutes", minute_future), ("seconds", seconds_future)):
+            try:
+                prices = future.result()
+            except Exception as e:
+                print(f"Error fetching {label} prices: {e}")
+                continue
+
+            print(f"received {len(prices)} for {label} prices in {(time.monotonic_ns() - t0) / 1e6:.2f} ms")
+
+            if len(prices):
+                print(f"Fetched {len(prices)} price datapoints")
+                if isinstance(prices, TradeArray):
+                    for t, p in zip(prices.ts[:3].tolist(), prices.price[:3].tolist()):
+                        print(t, p)
+                else:
+                    for price in prices[:min(3, len(prices))]:
                         print(price)
             else:
                 print(f"No price data returned")
 
-            print ("\n" + "="*70)
-                
-        except Exception as e:
-            print(f"Error fetching prices: {e}")
-
+            print("\n" + "-"*40 + "\n")
 
+        print ("\n" + "="*70)
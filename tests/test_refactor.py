@@ -9,35 +9,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from polymarket import APIClient
 
-def test_imports():
-    """Test that imports work correctly."""
-    print("✓ Successfully imported APIClient from polymarket")
-    
-def test_client_creation():
-    """Test that client can be created."""
+def test_smoke():
+    """Test that the client builds and exposes the expected API in one pass."""
     cache_dir = Path("data/cache/test_refactor")
     client = APIClient(cache_dir=cache_dir)
-    print(f"✓ Successfully created APIClient with cache_dir: {cache_dir}")
-    return client
-
-def test_closed_events_property(client):
-    """Test that closed_events property is accessible."""
     closed_api = client.closed_events
-    print(f"✓ Successfully accessed closed_events property: {type(closed_api).__name__}")
-    return closed_api
-
-def test_api_methods(closed_api):
-    """Test that API methods are available."""
-    assert hasattr(closed_api, 'iter_events'), "iter_events method missing"
-    assert hasattr(closed_api, 'fetch_all'), "fetch_all method missing"
-    print("✓ All expected methods are present on ClosedEventsAPI")
+    methods = ('iter_events', 'fetch_all', 'fetch_page_no_cache', 'fetch_page_etag')
+    assert all(hasattr(closed_api, m) for m in methods), \
+        f"missing methods: {[m for m in methods if not hasattr(closed_api, m)]}"
+    print(f"✓ APIClient ({cache_dir}) exposes {type(closed_api).__name__} with {', '.join(methods)}")
+    return client
 
 def test_lightweight_fetch(client):
     """Test a lightweight API call (preview mode)."""
     try:
-        # Use the no-cache preview method to test basic connectivity
-        events = client.closed_events.fetch_page_no_cache(limit=1, closed=True)
-        print(f"✓ Successfully fetched preview page with {len(events)} event(s)")
+        # A conditional GET: once the page's ETag is known, an unchanged page is a bodiless 304
+        events = client.closed_events.fetch_page_etag(limit=1, closed=True)
+        if events is None:
+            print("✓ Preview page unchanged since last run (304)")
+        else:
+            print(f"✓ Successfully fetched preview page with {len(events)} event(s)")
         return True
     except Exception as e:
         print(f"✗ Preview fetch failed: {e}")
@@ -47,10 +38,7 @@ def main():
     print("Testing refactored Polymarket API structure...\n")
     
     try:
-        test_imports()
-        client = test_client_creation()
-        closed_api = test_closed_events_property(client)
-        test_api_methods(closed_api)
+        client = test_smoke()
         test_lightweight_fetch(client)
         
         print("\n✓ All tests passed! The refactoring is working correctly.")